@@ -1,13 +1,69 @@
 # app/api/ingest.py
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query
+from app.models.schemas import IngestionResponse
 from app.services.ingestion_service import ingest_csv
+from app.services.job_service import (
+    get_ingestion_job,
+    get_ingestion_result,
+    submit_ingestion_job,
+)
+from app.utils.limits import INGEST_VALIDATE_RESPONSE
+from app.utils.serialization import FastJSONResponse
 
 router = APIRouter(prefix="/api/ingest", tags=["Ingestion"])
 
 
-@router.post("/csv")
-async def ingest_csv_endpoint(file: UploadFile = File(...)):
+def _respond(result: Dict) -> FastJSONResponse:
+    # Returning a Response skips FastAPI's response_model validation and
+    # jsonable_encoder pass; the model only documents the payload.
+    if INGEST_VALIDATE_RESPONSE:
+        IngestionResponse.model_validate(result)
+    return FastJSONResponse(result)
+
+
+def _require_csv(file: UploadFile):
     if not file.filename.endswith(".csv"):
         raise HTTPException(status_code=400, detail="Only CSV files are supported")
 
-    return await ingest_csv(file)
+
+@router.post("/csv", response_model=IngestionResponse)
+async def ingest_csv_endpoint(
+    file: UploadFile = File(...),
+    timings: bool = False,
+    columns: Optional[List[str]] = Query(None, description="Only parse these columns"),
+    exclude_columns: Optional[List[str]] = Query(None, description="Skip these columns"),
+    sections: Optional[List[str]] = Query(None, description="Only compute these response sections"),
+):
+    _require_csv(file)
+
+    return _respond(await ingest_csv(
+        file,
+        timings=timings,
+        columns=columns,
+        exclude_columns=exclude_columns,
+        sections=sections,
+    ))
+
+
+@router.post("/jobs", status_code=202)
+async def submit_job_endpoint(file: UploadFile = File(...)):
+    _require_csv(file)
+
+    job = submit_ingestion_job(file)
+    return {
+        **job,
+        "status_url": f"{router.prefix}/jobs/{job['job_id']}",
+        "result_url": f"{router.prefix}/jobs/{job['job_id']}/result",
+    }
+
+
+@router.get("/jobs/{job_id}")
+def job_status_endpoint(job_id: str):
+    return get_ingestion_job(job_id)
+
+
+@router.get("/jobs/{job_id}/result", response_model=IngestionResponse)
+def job_result_endpoint(job_id: str):
+    return _respond(get_ingestion_result(job_id))
@@ -0,0 +1,228 @@
+# app/engine/anomaly_engine.py
+from typing import Dict, List, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+ROLLING_WINDOW = 28          # trailing periods in the baseline
+MIN_HISTORY = 14             # periods needed before a point is scored
+Z_THRESHOLD = 4.5            # robust z-score that flags a spike / drop (~0.1% on pure noise)
+MIN_RELATIVE_SCALE = 0.05    # scale floor as a share of the baseline (flat series)
+MAD_SCALE = 1.4826           # MAD -> standard deviation under normality
+MAX_POINT_ANOMALIES = 10     # highest-scoring spikes / drops kept per series
+
+SHORT_SERIES_CHANGE = 0.5    # period-over-period change flagged below MIN_HISTORY + 1 periods
+
+CUSUM_DRIFT = 0.5            # k: shifts smaller than this (in robust SDs) are ignored
+CUSUM_THRESHOLD = 8.0        # h: alarm level
+CUSUM_CLIP = 3.0             # winsorize z so a single spike cannot raise an alarm
+MAX_CHANGE_POINTS = 5
+
+SEASON_LENGTHS = {"hourly": 24, "daily": 7}
+MIN_SEASON_OBSERVATIONS = 3
+
+
+def _seasons(codes: np.ndarray, frequency: str) -> Optional[np.ndarray]:
+    if frequency == "daily":
+        return (codes + 3) % 7          # Monday = 0; 1970-01-01 was a Thursday
+    if frequency == "hourly":
+        return codes % 24               # hour of day
+    return None
+
+
+def _deseasonalize(values: np.ndarray, codes: np.ndarray, frequency: str) -> np.ndarray:
+    """
+    Remove a weekday (daily) or hour-of-day (hourly) profile: each value
+    is shifted by its season's median minus the overall median. Seasons
+    never observed (weekends of business-day data) are ignored; skipped
+    until every observed season has enough observations.
+    """
+    seasons = _seasons(codes, frequency)
+    if seasons is None:
+        return values
+
+    length = SEASON_LENGTHS[frequency]
+    observed = np.bincount(seasons, minlength=length)
+    if observed[observed > 0].min() < MIN_SEASON_OBSERVATIONS:
+        return values
+
+    order = np.argsort(seasons, kind="stable")
+    bounds = np.searchsorted(seasons[order], np.arange(length + 1))
+    medians = np.array([
+        np.median(values[order[bounds[s]:bounds[s + 1]]]) if observed[s] else 0.0
+        for s in range(length)
+    ])
+    return values - (medians[seasons] - np.median(values))
+
+
+def _robust_scale(deviation: np.ndarray, baseline: np.ndarray) -> np.ndarray:
+    scale = np.maximum(MAD_SCALE * deviation, MIN_RELATIVE_SCALE * np.abs(baseline))
+    return np.where(scale > 0, scale, np.nan)
+
+
+def _rolling_robust_z(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Score each point against the median / MAD of the ROLLING_WINDOW
+    points before it. Full windows are evaluated in one strided 2-D
+    median; the short warm-up (< ROLLING_WINDOW points) separately.
+    """
+    n = len(values)
+    baseline = np.full(n, np.nan)
+    deviation = np.full(n, np.nan)
+
+    if n > ROLLING_WINDOW:
+        windows = sliding_window_view(values, ROLLING_WINDOW)[:-1]   # windows[i] precedes point i + W
+        medians = np.median(windows, axis=1)
+        baseline[ROLLING_WINDOW:] = medians
+        deviation[ROLLING_WINDOW:] = np.median(np.abs(windows - medians[:, None]), axis=1)
+
+    for i in range(MIN_HISTORY, min(ROLLING_WINDOW, n)):
+        history = values[:i]
+        baseline[i] = np.median(history)
+        deviation[i] = np.median(np.abs(history - baseline[i]))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = (values - baseline) / _robust_scale(deviation, baseline)
+    return {"z": z, "baseline": baseline}
+
+
+def _cusum_change_points(values: np.ndarray) -> List[Dict]:
+    """
+    Two-sided tabular CUSUM for sustained level shifts.
+
+    The recursion S_t = max(0, S_{t-1} + x_t - k) equals C_t - min(0, min C)
+    over the cumulative sum C, so each scan is a cumsum plus a running
+    minimum. After an alarm the reference level and scale are
+    re-estimated from the periods that follow it and scanning resumes.
+    """
+    n = len(values)
+    if n < 2 * MIN_HISTORY:
+        return []
+
+    # Scale from the current regime's reference window, floored by the
+    # spread of first differences (a level shift moves one difference
+    # only), so neither the shift being detected nor a flat stretch can
+    # collapse it
+    differences = np.diff(values)
+    difference_spread = float(np.median(np.abs(differences - np.median(differences)))) / np.sqrt(2)
+
+    def regime_scale(reference: np.ndarray, center: float) -> float:
+        spread = max(float(np.median(np.abs(reference - center))), difference_spread)
+        return float(_robust_scale(np.array([spread]), np.array([center]))[0])
+
+    reference = values[:ROLLING_WINDOW]
+    center = float(np.median(reference))
+    scale = regime_scale(reference, center)
+    if np.isnan(scale):
+        return []
+
+    changes = []
+    start = 0
+    while start < n - MIN_HISTORY and len(changes) < MAX_CHANGE_POINTS:
+        z = np.clip((values[start:] - center) / scale, -CUSUM_CLIP, CUSUM_CLIP)
+        best = None
+        for direction in (1, -1):
+            cumulative = np.cumsum(direction * z - CUSUM_DRIFT)
+            statistic = cumulative - np.minimum(np.minimum.accumulate(cumulative), 0.0)
+            alarms = np.flatnonzero(statistic > CUSUM_THRESHOLD)
+            if alarms.size == 0:
+                continue
+            alarm = int(alarms[0])
+            if best is None or alarm < best["alarm"]:
+                resets = np.flatnonzero(statistic[:alarm] <= 0)
+                onset = int(resets[-1]) + 1 if resets.size else 0
+                best = {
+                    "alarm": alarm,
+                    "onset": onset,
+                    "direction": direction,
+                    "statistic": float(statistic[alarm]),
+                }
+        if best is None:
+            break
+
+        onset, alarm = start + best["onset"], start + best["alarm"]
+        # New reference level from the points after the alarm: the stretch
+        # that raised it is biased towards the shift by selection
+        after = values[alarm + 1:alarm + 1 + ROLLING_WINDOW]
+        reference = after if after.size >= MIN_HISTORY else values[onset:alarm + 1]
+        new_level = float(np.median(reference))
+        changes.append({
+            "index": onset,
+            "kind": "shift_up" if best["direction"] > 0 else "shift_down",
+            "baseline": center,
+            "value": new_level,
+            "score": min(1.0, best["statistic"] / (2 * CUSUM_THRESHOLD)),
+            "statistic": best["statistic"],
+        })
+        center = new_level
+        scale = regime_scale(reference, center)
+        if np.isnan(scale):
+            break
+        start = alarm + 1
+
+    return changes
+
+
+def _short_series_changes(values: np.ndarray) -> List[Dict]:
+    """
+    Period-over-period changes of at least SHORT_SERIES_CHANGE, for
+    series too short for a rolling baseline (e.g. a year of months).
+    """
+    previous, current = values[:-1], values[1:]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        change = current / previous - 1
+    flagged = np.flatnonzero(np.isfinite(change) & (np.abs(change) >= SHORT_SERIES_CHANGE))
+    return [
+        {
+            "index": int(i) + 1,
+            "kind": "spike" if change[i] > 0 else "drop",
+            "baseline": float(previous[i]),
+            "value": float(current[i]),
+            "score": min(1.0, abs(float(change[i])) / (2 * SHORT_SERIES_CHANGE)),
+        }
+        for i in flagged
+    ]
+
+
+def _top_by_score(anomalies: List[Dict], limit: int) -> List[Dict]:
+    return sorted(anomalies, key=lambda a: -a["score"])[:limit]
+
+
+def detect_anomalies(values: np.ndarray, codes: np.ndarray, frequency: str) -> List[Dict]:
+    """
+    Spikes / drops (seasonally adjusted rolling median-MAD z-scores) and
+    level shifts (CUSUM) in a per-period series, in period order. Series
+    shorter than MIN_HISTORY + 1 periods fall back to period-over-period
+    changes.
+
+    Each anomaly has index, kind, baseline, value and a score in [0, 1]
+    (0.5 at the detection threshold); at most MAX_POINT_ANOMALIES spikes
+    / drops are kept. Deterministic and free of per-period Python loops
+    beyond the warm-up window.
+    """
+    values = np.asarray(values, dtype="float64")
+    if values.size < 2:
+        return []
+    if values.size < MIN_HISTORY + 1:
+        anomalies = _top_by_score(_short_series_changes(values), MAX_POINT_ANOMALIES)
+        return sorted(anomalies, key=lambda a: a["index"])
+
+    adjusted = _deseasonalize(values, codes, frequency)
+    scored = _rolling_robust_z(adjusted)
+    z = scored["z"]
+
+    anomalies = []
+    for i in np.flatnonzero(np.abs(np.nan_to_num(z)) >= Z_THRESHOLD):
+        anomalies.append({
+            "index": int(i),
+            "kind": "spike" if z[i] > 0 else "drop",
+            "baseline": float(scored["baseline"][i]),
+            "value": float(adjusted[i]),
+            "z": float(z[i]),
+            "score": min(1.0, abs(float(z[i])) / (2 * Z_THRESHOLD)),
+        })
+
+    anomalies = _top_by_score(anomalies, MAX_POINT_ANOMALIES)
+    anomalies.extend(_cusum_change_points(adjusted))
+    anomalies.sort(key=lambda a: a["index"])
+    return anomalies
@@ -107,8 +107,8 @@ def map_insights_to_charts(
         for sig in time_series["signals"]:
             code = sig["code"]
 
-            # Sudden Drop / Spike → Line Chart
-            if code in {"SUDDEN_DROP", "SUDDEN_SPIKE"}:
+            # Sudden Drop / Spike / Level Shift → Line Chart
+            if code in {"SUDDEN_DROP", "SUDDEN_SPIKE", "TREND_SHIFT"}:
                 annotation = None
                 if sig.get("period"):
                     annotation = {
@@ -116,33 +116,43 @@ def map_insights_to_charts(
                         "label": sig["message"],
                     }
 
+                # Metric signals chart the metric's per-period sum
+                metric = sig.get("metric")
+                metric_data = (time_series.get("metrics") or {}).get(metric)
+                if metric and metric_data:
+                    title = f"{metric} over time ({time_series.get('frequency')})"
+                    data, y_key = metric_data, "sum"
+                else:
+                    title = f"Activity trend over time ({time_series.get('frequency')})"
+                    data, y_key = series_data, "count"
+
                 charts.append({
                     "insight_code": code,
-                    "title": f"Activity trend over time ({time_series.get('frequency')})",
+                    "title": title,
                     "type": "line",
-                    "data": series_data,
+                    "data": data,
                     "xKey": "period",
-                    "yKey": "count",
+                    "yKey": y_key,
                     "annotations": [annotation] if annotation else [],
                     "caption": sig["message"],
                 })
 
-            # Missing Periods → Bar Chart
+            # Missing Periods → Bar Chart (one bar per gap range)
             if code == "MISSING_PERIODS":
-                missing_count = 0
-                if sig.get("evidence"):
-                    try:
-                        missing_count = int(sig["evidence"][0].split("=")[1])
-                    except Exception:
-                        missing_count = 0
+                gaps = sig.get("gaps") or []
+                data = [
+                    {
+                        "label": gap["start"] if gap["length"] == 1 else f"{gap['start']} – {gap['end']}",
+                        "count": gap["length"],
+                    }
+                    for gap in gaps
+                ]
 
                 charts.append({
                     "insight_code": code,
                     "title": "Missing time periods detected",
                     "type": "bar",
-                    "data": [
-                        {"label": "Missing periods", "count": missing_count}
-                    ],
+                    "data": data,
                     "xKey": "label",
                     "yKey": "count",
                     "caption": "Data gaps detected that may distort trend analysis.",
@@ -0,0 +1,250 @@
+# app/engine/column_summary.py
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.engine.parallel_summary import PARALLEL_MIN_CELLS, parallel_value_counts
+from app.engine.sketches import HyperLogLog, SpaceSaving, hash_values
+
+IQR_MULTIPLIER = 1.5
+BATCHED_MIN_COLUMNS = 50     # auto-switch to block mode for wide frames
+BLOCK_COLUMNS = 128          # numeric columns per 2-D block (bounds the float64 copy)
+
+
+def _is_numeric(dtype) -> bool:
+    return pd.api.types.is_numeric_dtype(dtype)
+
+
+def _is_text(dtype) -> bool:
+    return not (
+        pd.api.types.is_numeric_dtype(dtype)
+        or pd.api.types.is_bool_dtype(dtype)
+        or pd.api.types.is_datetime64_any_dtype(dtype)
+    )
+
+
+def _numeric_block_summary(block: np.ndarray) -> List[Optional[Dict]]:
+    """
+    Order statistics for every column of a 2-D float block at once.
+
+    One column-wise sort (NaN sorts last) yields min/max, distinct counts
+    and interpolated quantiles via per-column index arithmetic; outliers
+    are counted with a broadcast comparison. Quantiles use linear
+    interpolation, matching pandas defaults.
+    """
+    rows, width = block.shape
+    if rows == 0:
+        return [{"unique_count": 0, "numeric": None} for _ in range(width)]
+
+    ordered = np.sort(block, axis=0)
+    valid = (~np.isnan(ordered)).sum(axis=0)
+
+    # Distinct non-null values: first value plus every change between neighbours
+    changes = (ordered[1:] != ordered[:-1]) & (np.arange(1, rows)[:, None] < valid)
+    unique_counts = np.minimum(valid, 1) + changes.sum(axis=0)
+
+    last = np.maximum(valid - 1, 0)
+    cols = np.arange(width)
+
+    def quantile(q: float) -> np.ndarray:
+        position = q * last
+        lo = np.floor(position).astype("int64")
+        hi = np.minimum(lo + 1, last)
+        frac = position - lo
+        low_vals = ordered[lo, cols]
+        return low_vals + frac * (ordered[hi, cols] - low_vals)
+
+    q1, median, q3 = quantile(0.25), quantile(0.5), quantile(0.75)
+    iqr = q3 - q1
+    lower = q1 - IQR_MULTIPLIER * iqr
+    upper = q3 + IQR_MULTIPLIER * iqr
+    outliers = ((ordered < lower) | (ordered > upper)).sum(axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.nansum(ordered, axis=0) / valid
+
+    results = []
+    for j in range(width):
+        if valid[j] == 0:
+            results.append({"unique_count": 0, "numeric": None})
+            continue
+        results.append({
+            "unique_count": int(unique_counts[j]),
+            "numeric": {
+                "min": float(ordered[0, j]),
+                "max": float(ordered[last[j], j]),
+                "mean": float(means[j]),
+                "q1": float(q1[j]),
+                "median": float(median[j]),
+                "q3": float(q3[j]),
+                "iqr_lower_bound": float(lower[j]),
+                "iqr_upper_bound": float(upper[j]),
+                "outlier_count": int(outliers[j]),
+            },
+        })
+    return results
+
+
+def _value_counts(series: pd.Series) -> pd.Series:
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    order = np.argsort(-counts, kind="stable")   # ties keep first-seen order
+    # Null-typed Arrow columns factorize to a single <NA> unique with no rows
+    order = order[counts[order] > 0]
+    return pd.Series(counts[order], index=pd.Index(uniques).take(order))
+
+
+def _summary(dtype, rows: int, null_count: int = 0) -> Dict:
+    return {
+        "rows": rows,
+        "null_count": null_count,
+        "null_ratio": null_count / rows if rows else 0.0,
+        "unique_count": 0,
+        "value_counts": None,       # filled for non-numeric columns only
+        "is_numeric": _is_numeric(dtype),
+        "is_text": _is_text(dtype),
+        "numeric": None,
+        "approximate": None,        # error bounds when counts come from sketches
+    }
+
+
+def _sketch_counts(series: pd.Series, non_null: int) -> Dict:
+    """
+    Distinct count (HyperLogLog) and top values (Space-Saving) without
+    building a hash table of every distinct value.
+    """
+    distinct = HyperLogLog()
+    distinct.update(hash_values(series))
+    heavy = SpaceSaving()
+    heavy.update(series)
+
+    return {
+        "unique_count": min(distinct.estimate(), non_null),
+        "value_counts": heavy.top(heavy.k),
+        "approximate": {
+            "unique_count_rse": distinct.relative_error,
+            "top_count_max_error": heavy.max_error(),
+        },
+    }
+
+
+def summarize_column(series: pd.Series, sketch: bool = False) -> Dict:
+    """
+    Compute every per-column primitive exactly once:
+    null mask, factorized value counts (non-numeric) or one sort
+    for distinct count and quantiles (numeric).
+    sketch=True replaces the value counts of non-numeric columns with
+    HyperLogLog / Space-Saving estimates.
+    """
+    null_mask = series.isna().to_numpy()
+    summary = _summary(series.dtype, len(series), int(null_mask.sum()))
+
+    if summary["is_numeric"]:
+        values = series[~null_mask].to_numpy(dtype="float64")
+        summary.update(_numeric_block_summary(values.reshape(-1, 1))[0])
+    elif sketch:
+        summary.update(_sketch_counts(series, len(series) - summary["null_count"]))
+    else:
+        summary["value_counts"] = _value_counts(series)
+        summary["unique_count"] = int(len(summary["value_counts"]))
+
+    return summary
+
+
+def _summarize_batched(
+    df: pd.DataFrame,
+    workers: int = 0,
+    sketch: bool = False,
+) -> Dict[str, Dict]:
+    """
+    Block-wise variant of summarize_column for wide frames: null counts
+    and numeric statistics are computed per dtype block in a handful of
+    NumPy calls instead of one pandas call per column. Value counts of
+    non-numeric columns can be spread over `workers` processes.
+    """
+    rows = len(df)
+    summaries = {col: _summary(dtype, rows) for col, dtype in df.dtypes.items()}
+
+    num_cols = [col for col in df.columns if summaries[col]["is_numeric"]]
+    other_cols = [col for col in df.columns if not summaries[col]["is_numeric"]]
+
+    for start in range(0, len(num_cols), BLOCK_COLUMNS):
+        block_cols = num_cols[start:start + BLOCK_COLUMNS]
+        block = df[block_cols].to_numpy(dtype="float64", na_value=np.nan)
+        null_counts = np.isnan(block).sum(axis=0)
+        for col, nulls, result in zip(block_cols, null_counts, _numeric_block_summary(block)):
+            summaries[col].update(result)
+            summaries[col]["null_count"] = int(nulls)
+            summaries[col]["null_ratio"] = int(nulls) / rows if rows else 0.0
+
+    if other_cols:
+        null_counts = df[other_cols].isna().sum()
+
+        pooled = {}
+        if not sketch and workers > 1 and rows * len(other_cols) >= PARALLEL_MIN_CELLS:
+            pooled = parallel_value_counts(df, other_cols, workers)
+
+        for col in other_cols:
+            nulls = int(null_counts[col])
+            summaries[col].update({
+                "null_count": nulls,
+                "null_ratio": nulls / rows if rows else 0.0,
+            })
+            if sketch:
+                summaries[col].update(_sketch_counts(df[col], rows - nulls))
+                continue
+
+            value_counts = pooled[col] if col in pooled else _value_counts(df[col])
+            summaries[col].update({
+                "unique_count": int(len(value_counts)),
+                "value_counts": value_counts,
+            })
+
+    return summaries
+
+
+def summarize_columns(
+    df: pd.DataFrame,
+    batched: Optional[bool] = None,
+    workers: int = 0,
+    sketch: bool = False,
+) -> Dict[str, Dict]:
+    """
+    batched=None switches to block mode once the frame has
+    BATCHED_MIN_COLUMNS columns; both modes return identical summaries.
+    workers > 1 enables the process pool (block mode only).
+    sketch=True estimates distinct counts and top values of non-numeric
+    columns; value_counts then only holds the heavy hitters.
+    """
+    if batched is None:
+        batched = workers > 1 or len(df.columns) >= BATCHED_MIN_COLUMNS
+    if batched:
+        return _summarize_batched(df, workers, sketch)
+    return {col: summarize_column(df[col], sketch) for col in df.columns}
+
+
+def entropy_from_counts(
+    value_counts: pd.Series,
+    total: Optional[int] = None,
+    distinct: Optional[int] = None,
+) -> float:
+    """
+    Shannon entropy in bits. When value_counts only holds the top values
+    (sketch mode), pass the non-null `total` and estimated `distinct`
+    count: the remaining mass is assumed uniform over the unseen values.
+    """
+    counts = value_counts.to_numpy(dtype="float64")
+    total = float(counts.sum() if total is None else total)
+    if total <= 0:
+        return 0.0
+
+    p = counts / total
+    p = p[p > 0]
+    entropy = float(-(p * np.log2(p)).sum())
+
+    rest = 1.0 - p.sum()
+    unseen = (distinct or 0) - len(counts)
+    if rest > 0 and unseen > 0:
+        entropy -= rest * np.log2(rest / unseen)
+    return entropy
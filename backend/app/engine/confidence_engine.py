@@ -16,7 +16,12 @@ def compute_confidence(
     factors = []
 
     # --- Sampling impact ---
-    if ingestion_meta.get("sampled"):
+    if ingestion_meta.get("sampled") and ingestion_meta.get("exact_stats"):
+        # Counts are exact over every row; only distribution metrics are sampled
+        ratio = ingestion_meta.get("sampling_ratio", 1.0)
+        score *= min(1.0, 0.9 + ratio)
+        factors.append("sampled_data_exact_counts")
+    elif ingestion_meta.get("sampled"):
         ratio = ingestion_meta.get("sampling_ratio", 1.0)
         score *= min(1.0, 0.6 + ratio)  # floor confidence at 0.6
         factors.append("sampled_data")
@@ -42,6 +47,13 @@ def compute_confidence(
         score *= 0.8
         factors.append("weak_signal")
 
+    # --- Anomaly strength (time-series signals) ---
+    anomaly_score = insight.get("anomaly_score")
+    if anomaly_score is not None:
+        # 0.5 sits at the detection threshold; barely-over points lose up to 20%
+        score *= 0.8 + 0.2 * min(anomaly_score, 1.0)
+        factors.append("strong_anomaly" if anomaly_score >= 0.75 else "weak_anomaly")
+
     # Clamp
     score = max(0.3, min(score, 1.0))
 
@@ -1,40 +1,459 @@
 # app/engine/csv_parser.py
+import codecs
+import io
+import mmap
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
 import pandas as pd
 from fastapi import UploadFile
+from pandas._libs.parsers import STR_NA_VALUES
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    ARROW_ERRORS = (pa.ArrowInvalid,)
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pa_csv = None
+    ARROW_ERRORS = ()
 
 MAX_ROWS = 50_000
 SAMPLE_SEED = 42
 
+CHUNK_ROWS = 100_000                          # rows per chunk in streaming mode
+STREAMING_THRESHOLD_BYTES = 25 * 1024 * 1024  # uploads above this are streamed
+ENCODING_BLOCK_BYTES = 16 * 1024 * 1024      # UTF-8 validation block (~1 ms per MB)
+COPY_BLOCK_BYTES = 1024 * 1024
+
+CSV_ENGINE = os.getenv("CSV_ENGINE", "pandas")   # "pandas" | "pyarrow"
+ARROW_BLOCK_BYTES = 16 * 1024 * 1024              # pyarrow block (and chunk) size
+NA_VALUES = sorted(STR_NA_VALUES)                 # read_csv's default missing markers
 
-def parse_csv(file: UploadFile):
+BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+# --------------------------------------------------
+# Upload buffer (spooled to disk once, memory-mapped)
+# --------------------------------------------------
+class _MappedReader(io.RawIOBase):
     """
-    Parse CSV with encoding fallback and large-data sampling.
-    Returns: (df, metadata)
+    Raw binary reader over an mmap, so pandas reads straight from the
+    page cache instead of through a second file buffer.
+    """
+
+    def __init__(self, mapped: mmap.mmap):
+        self._mapped = mapped
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        with memoryview(self._mapped) as view:
+            block = view[self._pos:self._pos + len(buffer)]
+            size = len(block)
+            buffer[:size] = block
+            block.release()
+        self._pos += size
+        return size
+
+
+@contextmanager
+def _mapped_upload(file: UploadFile) -> Iterator[Optional[mmap.mmap]]:
     """
+    Yield a read-only mmap of the upload (None when empty).
 
-    file.file.seek(0)
+    Starlette's SpooledTemporaryFile is rolled over to its temp file by
+    fileno(), so the body hits disk exactly once; objects without a file
+    descriptor are copied to a temp file first.
+    """
+    fileobj = file.file
+    copy = None
+    try:
+        fd = fileobj.fileno()
+        fileobj.flush()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        copy = tempfile.TemporaryFile()
+        fileobj.seek(0)
+        shutil.copyfileobj(fileobj, copy, COPY_BLOCK_BYTES)
+        copy.flush()
+        fd = copy.fileno()
 
+    mapped = None
     try:
-        df = pd.read_csv(file.file, encoding="utf-8")
-    except UnicodeDecodeError:
-        file.file.seek(0)
-        df = pd.read_csv(file.file, encoding="latin1")
+        if os.fstat(fd).st_size > 0:
+            mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        yield mapped
+    finally:
+        if mapped is not None:
+            mapped.close()
+        if copy is not None:
+            copy.close()
+        fileobj.seek(0)
+
+
+def _open_reader(mapped: Optional[mmap.mmap]) -> io.BufferedIOBase:
+    if mapped is None:
+        return io.BytesIO(b"")
+    return io.BufferedReader(_MappedReader(mapped), buffer_size=COPY_BLOCK_BYTES)
+
+
+def detect_encoding(mapped: Optional[mmap.mmap]) -> str:
+    """
+    BOM first, then strict UTF-8 validation of the whole upload, block by
+    block. Anything that is not valid UTF-8 is read as latin1, which
+    decodes every byte, so no character is ever replaced.
+    """
+    if mapped is None:
+        return "utf-8"
+    for bom, encoding in BOM_ENCODINGS:
+        if mapped[:len(bom)] == bom:
+            return encoding
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with memoryview(mapped) as view:
+        try:
+            for start in range(0, len(view), ENCODING_BLOCK_BYTES):
+                with view[start:start + ENCODING_BLOCK_BYTES] as block:
+                    decoder.decode(block)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return "latin1"
+    return "utf-8"
+
+
+def _read_options(encoding: str) -> dict:
+    return {"encoding": encoding}
+
+
+def _header(mapped: Optional[mmap.mmap], encoding: str) -> List[str]:
+    # Raw header cells: pandas would rename duplicate headers ("a.1")
+    header = pd.read_csv(
+        _open_reader(mapped), header=None, nrows=1, dtype=str, keep_default_na=False,
+        **_read_options(encoding),
+    )
+    return list(header.iloc[0]) if len(header) else []
+
+
+def select_columns(
+    header: List[str],
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> Optional[List[int]]:
+    """
+    File positions kept by the include / exclude name lists (None when
+    every column is kept). A name selects every column carrying it.
+    """
+    include, exclude = set(include or ()), set(exclude or ())
+    if not include and not exclude:
+        return None
+
+    unknown = sorted((include | exclude) - set(header))
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+
+    keep = (include or set(header)) - exclude
+    positions = [i for i, name in enumerate(header) if name in keep]
+    if not positions:
+        raise ValueError("No columns left after column selection")
+    return positions
+
+
+def _reservoir_sample(
+    chunks: Iterable[pd.DataFrame],
+    k: int,
+    seed: int,
+) -> Tuple[pd.DataFrame, int]:
+    """
+    Keep a uniform random sample of `k` rows from a stream of chunks.
+
+    Every row gets a random key and the reservoir holds the `k` smallest
+    keys seen so far (bottom-k sampling). Once the reservoir is full only
+    rows beating the current worst key are materialized, so memory stays
+    proportional to `k` plus one chunk. Rows are kept in file order.
+    """
+    rng = np.random.default_rng(seed)
+
+    reservoir: Optional[pd.DataFrame] = None
+    keys: Optional[np.ndarray] = None
+    total_rows = 0
+
+    for chunk in chunks:
+        total_rows += len(chunk)
+        chunk_keys = rng.random(len(chunk))
+
+        if reservoir is not None and len(reservoir) >= k:
+            candidates = chunk_keys < keys.max()
+            if not candidates.any():
+                continue
+            chunk = chunk[candidates]
+            chunk_keys = chunk_keys[candidates]
+
+        if reservoir is None:
+            pool, pool_keys = chunk, chunk_keys
+        else:
+            pool = pd.concat([reservoir, chunk])
+            pool_keys = np.concatenate([keys, chunk_keys])
+
+        if len(pool) > k:
+            keep = np.sort(np.argpartition(pool_keys, k - 1)[:k])
+            pool = pool.iloc[keep]
+            pool_keys = pool_keys[keep]
+
+        reservoir, keys = pool, pool_keys
+
+    if reservoir is None:
+        reservoir = pd.DataFrame()
+
+    return reservoir, total_rows
+
+
+def _observed(chunks: Iterable[pd.DataFrame], accumulator) -> Iterator[pd.DataFrame]:
+    for chunk in chunks:
+        accumulator.update(chunk)
+        yield chunk
+
+
+# --------------------------------------------------
+# pyarrow engine (multi-threaded, Arrow-backed dtypes)
+# --------------------------------------------------
+def _arrow_source(mapped: Optional[mmap.mmap]):
+    return pa.BufferReader(pa.py_buffer(mapped) if mapped is not None else b"")
+
+
+def _arrow_read_options():
+    # Only validated UTF-8 reaches Arrow (see parse_csv); it skips a BOM itself
+    return pa_csv.ReadOptions(encoding="utf8", block_size=ARROW_BLOCK_BYTES)
+
+
+def _arrow_convert_options():
+    # Same missing cells as pandas: "" and "NA" are null in string columns too
+    return pa_csv.ConvertOptions(null_values=NA_VALUES, strings_can_be_null=True)
+
+
+def _arrow_open(mapped: Optional[mmap.mmap], reader):
+    return reader(
+        _arrow_source(mapped),
+        read_options=_arrow_read_options(),
+        convert_options=_arrow_convert_options(),
+    )
+
+
+def _arrow_frame(data) -> pd.DataFrame:
+    return data.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _pandas_names(mapped: Optional[mmap.mmap], encoding: str) -> List[str]:
+    # Arrow keeps duplicate and empty header cells as they are; the pandas
+    # engine renames them ("a.1", "Unnamed: 2")
+    return list(pd.read_csv(_open_reader(mapped), nrows=0, **_read_options(encoding)).columns)
+
+
+def _arrow_select(data, names: List[str], usecols: Optional[List[int]]):
+    # By position: include_columns is by name, which is ambiguous for duplicate headers
+    # Columns with no values at all are float in pandas; Arrow infers null
+    positions = range(data.num_columns) if usecols is None else usecols
+    columns = [data.column(i) for i in positions]
+    return type(data).from_arrays(
+        [col.cast(pa.float64()) if pa.types.is_null(col.type) else col for col in columns],
+        names=[names[i] for i in positions],
+    )
+
+
+def _read_arrow(
+    mapped: Optional[mmap.mmap],
+    encoding: str,
+    usecols: Optional[List[int]] = None,
+) -> pd.DataFrame:
+    table = _arrow_open(mapped, pa_csv.read_csv)
+    return _arrow_frame(_arrow_select(table, _pandas_names(mapped, encoding), usecols))
+
+
+def _arrow_chunks(
+    mapped: Optional[mmap.mmap],
+    encoding: str,
+    usecols: Optional[List[int]] = None,
+) -> Iterator[pd.DataFrame]:
+    reader = _arrow_open(mapped, pa_csv.open_csv)
+    names = _pandas_names(mapped, encoding)
+    offset = 0
+    for batch in reader:
+        chunk = _arrow_frame(_arrow_select(batch, names, usecols))
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        offset += len(chunk)
+        yield chunk
+
+
+# --------------------------------------------------
+# Readers
+# --------------------------------------------------
+def _read_full(
+    mapped: Optional[mmap.mmap],
+    encoding: str,
+    engine: str,
+    usecols: Optional[List[int]] = None,
+) -> pd.DataFrame:
+    if engine == "pyarrow":
+        return _read_arrow(mapped, encoding, usecols)
+    return pd.read_csv(_open_reader(mapped), usecols=usecols, **_read_options(encoding))
+
+
+def _iter_chunks(
+    mapped: Optional[mmap.mmap],
+    encoding: str,
+    engine: str,
+    usecols: Optional[List[int]] = None,
+) -> Iterator[pd.DataFrame]:
+    if engine == "pyarrow":
+        yield from _arrow_chunks(mapped, encoding, usecols)
+        return
+
+    with pd.read_csv(
+        _open_reader(mapped), chunksize=CHUNK_ROWS, usecols=usecols, **_read_options(encoding)
+    ) as reader:
+        yield from reader
+
+
+def _read_streaming(
+    mapped: Optional[mmap.mmap],
+    encoding: str,
+    engine: str,
+    accumulator=None,
+    usecols: Optional[List[int]] = None,
+) -> Tuple[pd.DataFrame, int]:
+    if accumulator is not None:
+        accumulator.reset()
+
+    reader = _iter_chunks(mapped, encoding, engine, usecols)
+    chunks = reader if accumulator is None else _observed(reader, accumulator)
+    sample, total_rows = _reservoir_sample(chunks, MAX_ROWS, SAMPLE_SEED)
+
+    # Second pass over the mapped file, restricted to the columns asked for
+    if accumulator is not None:
+        second = accumulator.second_pass_columns()
+        if second:
+            # Positions are within the selected columns; map them back to the file
+            file_positions = [usecols[i] for i in second] if usecols is not None else second
+            for chunk in _iter_chunks(mapped, encoding, engine, file_positions):
+                accumulator.second_pass(chunk)
+
+    return sample, total_rows
+
+
+def _parse(mapped, encoding, engine, streaming, accumulator, usecols) -> Tuple[pd.DataFrame, int]:
+    if streaming:
+        return _read_streaming(mapped, encoding, engine, accumulator, usecols)
+
+    df = _read_full(mapped, encoding, engine, usecols)
+    if accumulator is not None and len(df) > MAX_ROWS:
+        accumulator.reset()
+        accumulator.update(df)
+        usecols = accumulator.second_pass_columns()
+        if usecols:
+            accumulator.second_pass(df.iloc[:, usecols])
+    return df, len(df)
+
+
+def resolve_engine(engine: Optional[str] = None) -> str:
+    """
+    The engine a parse starts with: `engine` or CSV_ENGINE, pandas when
+    pyarrow is not importable.
+    """
+    engine = engine or CSV_ENGINE
+    if engine == "pyarrow" and pa is None:
+        return "pandas"
+    return engine
+
+
+def parse_csv(
+    file: UploadFile,
+    streaming: Optional[bool] = None,
+    accumulator=None,
+    engine: Optional[str] = None,
+    columns: Optional[Iterable[str]] = None,
+    exclude_columns: Optional[Iterable[str]] = None,
+):
+    """
+    Parse CSV with whole-file encoding detection and large-data sampling.
+    The upload is memory-mapped and parsed exactly once.
+
+    streaming=None picks the mode from the upload size: large uploads are
+    read chunk by chunk into a reservoir sample so peak memory depends on
+    MAX_ROWS rather than file size.
+
+    `accumulator` (e.g. FullDataStats) sees every row before sampling;
+    metadata["exact_stats"] tells callers whether it was fed. Columns it
+    returns from second_pass_columns() are then fed again, chunk by
+    chunk, to second_pass().
+
+    engine="pyarrow" (default from CSV_ENGINE) uses pyarrow.csv and
+    Arrow-backed dtypes. Files that are not UTF-8 go straight to the
+    pandas C engine, which also takes over when pyarrow is missing or
+    rejects the file (e.g. a type change after the first block); the
+    engine used is reported in metadata["engine"].
+
+    `columns` / `exclude_columns` are header names to keep / drop; they
+    are resolved against the raw header and passed to the reader as
+    positions, so dropped columns are never converted (pyarrow parses
+    them and drops them before the pandas conversion).
+    Returns: (df, metadata)
+    """
+
+    with _mapped_upload(file) as mapped:
+        size = len(mapped) if mapped is not None else 0
+        encoding = detect_encoding(mapped)
+
+        if streaming is None:
+            streaming = size > STREAMING_THRESHOLD_BYTES
+
+        # Arrow would transcode anything but UTF-8 through Python codecs
+        engine = resolve_engine(engine)
+        if not encoding.startswith("utf-8"):
+            engine = "pandas"
+
+        usecols, total_columns = None, None
+        if columns or exclude_columns:
+            header = _header(mapped, encoding)
+            usecols = select_columns(header, columns, exclude_columns)
+            total_columns = len(header)
 
-    total_rows = len(df)
+        try:
+            df, total_rows = _parse(mapped, encoding, engine, streaming, accumulator, usecols)
+        except ARROW_ERRORS:
+            if mapped is None:
+                raise ValueError("No columns to parse from file")
+            engine = "pandas"
+            df, total_rows = _parse(mapped, encoding, engine, streaming, accumulator, usecols)
 
     metadata = {
         "total_rows": total_rows,
         "sampled": False,
         "sample_size": total_rows,
         "sampling_ratio": 1.0,
+        "streamed": bool(streaming),
+        "encoding": encoding,
+        "engine": engine,
+        "exact_stats": False,
+        "total_columns": total_columns if total_columns is not None else len(df.columns),
     }
 
     if total_rows > MAX_ROWS:
-        df = df.sample(n=MAX_ROWS, random_state=SAMPLE_SEED)
+        if not streaming:
+            df = df.sample(n=MAX_ROWS, random_state=SAMPLE_SEED)
         metadata.update({
             "sampled": True,
             "sample_size": MAX_ROWS,
             "sampling_ratio": MAX_ROWS / total_rows,
+            "exact_stats": accumulator is not None,
         })
 
     if df.empty:
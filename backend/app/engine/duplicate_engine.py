@@ -0,0 +1,399 @@
+# app/engine/duplicate_engine.py
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Comma-separated columns for near-duplicate detection (e.g. "email,order_id")
+DUPLICATE_KEY_COLUMNS = [
+    col.strip() for col in os.getenv("DUPLICATE_KEY_COLUMNS", "").split(",") if col.strip()
+]
+DUPLICATE_VERIFY = os.getenv("DUPLICATE_VERIFY", "1") == "1"   # exact re-check of hash matches
+MAX_CLUSTERS = 5                     # most repeated rows reported
+MAX_TRACKED_ROW_HASHES = 10_000_000  # exact hash counts kept before switching to a Bloom filter
+BLOOM_BITS = 1 << 28                 # 32 MiB filter
+BLOOM_HASHES = 7
+EXAMPLE_CANDIDATES = 100             # repeated rows that keep an example while streaming
+EXAMPLE_BLOOM_BITS = 1 << 25         # 4 MiB filter of rows seen, for finding repeats early
+EXAMPLE_BLOOM_HASHES = 2             # false positives only add short-lived candidates
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _mix(words: np.ndarray) -> np.ndarray:
+    """
+    splitmix64 finalizer: a cheap, well-distributed 64-bit mixer.
+    """
+    words = words ^ (words >> np.uint64(30))
+    words = words * np.uint64(0xBF58476D1CE4E5B9)
+    words = words ^ (words >> np.uint64(27))
+    words = words * np.uint64(0x94D049BB133111EB)
+    return words ^ (words >> np.uint64(31))
+
+
+# --------------------------------------------------
+# Row keys (one frame) and row hashes (across chunks)
+# --------------------------------------------------
+def _is_text(series: pd.Series) -> bool:
+    return pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+
+
+def _column_codes(series: pd.Series, normalize: bool = False) -> np.ndarray:
+    """
+    Integer code per row, equal codes for equal values (NA is -1).
+    `normalize` folds case and surrounding whitespace of text values.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy().astype("int64")
+        if normalize and _is_text(series.cat.categories.to_series()):
+            categories = series.cat.categories.to_series().astype("string").str.strip().str.casefold()
+            folded, _ = pd.factorize(categories)
+            codes = np.where(codes >= 0, folded[np.maximum(codes, 0)], -1)
+        return codes
+
+    if normalize and _is_text(series):
+        series = series.astype("string").str.strip().str.casefold()
+    codes, _ = pd.factorize(series, use_na_sentinel=True)
+    return codes.astype("int64")
+
+
+def row_keys(
+    df: pd.DataFrame,
+    columns: Optional[Sequence[str]] = None,
+    normalize: bool = False,
+) -> np.ndarray:
+    """
+    64-bit key per row, equal for equal rows, built from per-column
+    factorize codes (category codes are reused as-is). Cheaper than
+    hashing every value, but only comparable within one frame.
+    """
+    keys = np.zeros(len(df), dtype="uint64")
+    positions = range(df.shape[1]) if columns is None else [df.columns.get_loc(col) for col in columns]
+    for position in positions:
+        codes = _column_codes(df.iloc[:, position], normalize).astype("uint64")   # NA (-1) wraps, still distinct
+        keys = _mix(keys * _GOLDEN + codes)
+    return keys
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Stable 64-bit hashes of whole rows, comparable across chunks and
+    frames. Numerics are hashed as float64 so int and float chunks of
+    the same column agree.
+    """
+    columns = {}
+    for position in range(df.shape[1]):   # by position: headers may repeat
+        series = df.iloc[:, position]
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            series = series.astype("float64")
+        columns[position] = series
+    frame = pd.DataFrame(columns, copy=False)
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+def _plain(value):
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    if hasattr(value, "item"):      # numpy scalars
+        return value.item()
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    return str(value)
+
+
+def _row_values(df: pd.DataFrame, position: int) -> Dict:
+    return {str(col): _plain(value) for col, value in df.iloc[position].items()}
+
+
+def _example_row(df: pd.DataFrame, position: int) -> Optional[int]:
+    # Parsed frames keep file row numbers in their index, also after sampling
+    label = df.index[position]
+    return int(label) if pd.api.types.is_integer(label) else None
+
+
+def _clusters(keys: np.ndarray, positions: np.ndarray, df: pd.DataFrame) -> List[Dict]:
+    uniques, first, counts = np.unique(keys, return_index=True, return_counts=True)
+    top = np.argsort(-counts, kind="stable")[:MAX_CLUSTERS]
+    return [
+        {
+            "count": int(counts[i]),
+            "example_row": _example_row(df, int(positions[first[i]])),
+            "values": _row_values(df, int(positions[first[i]])),
+        }
+        for i in top
+    ]
+
+
+# --------------------------------------------------
+# Duplicates in one frame
+# --------------------------------------------------
+def find_duplicates(
+    df: pd.DataFrame,
+    key_columns: Optional[Sequence[str]] = None,
+    verify: bool = DUPLICATE_VERIFY,
+) -> Dict:
+    """
+    Exact duplicate rows, the most repeated rows, and near-duplicates
+    (rows repeating `key_columns` after case / whitespace folding but
+    differing elsewhere).
+
+    Rows are matched on 64-bit row keys. With `verify`, only rows whose
+    key repeats are compared value by value, so the count is exact and
+    `hash_collisions` reports the key matches that were not real
+    duplicates.
+    """
+    result = {
+        "duplicate_rows": 0,
+        "clusters": [],
+        "verified": bool(verify),
+        "hash_collisions": 0 if verify else None,
+        "key_columns": [],
+        "near_duplicate_rows": None,
+    }
+    if df.empty:
+        return result
+
+    keys = row_keys(df)
+    repeated = pd.Series(keys).duplicated(keep=False).to_numpy()
+    candidates = np.flatnonzero(repeated)
+
+    if candidates.size:
+        hashed_duplicates = int(candidates.size - np.unique(keys[candidates]).size)
+        duplicates = hashed_duplicates
+        if verify:
+            exact = df.iloc[candidates].duplicated(keep=False).to_numpy()
+            duplicates = int(df.iloc[candidates[exact]].duplicated().sum())
+            result["hash_collisions"] = hashed_duplicates - duplicates
+            candidates = candidates[exact]
+        result["duplicate_rows"] = duplicates
+        result["clusters"] = _clusters(keys[candidates], candidates, df) if candidates.size else []
+
+    unique_columns = df.columns[~df.columns.duplicated()]
+    key_columns = [col for col in key_columns or () if col in unique_columns]
+    if key_columns:
+        subset = row_keys(df, key_columns, normalize=True)
+        key_duplicates = int(len(subset) - np.unique(subset).size)
+        result["key_columns"] = key_columns
+        # Every exact duplicate also repeats its key
+        result["near_duplicate_rows"] = max(key_duplicates - result["duplicate_rows"], 0)
+
+    return result
+
+
+# --------------------------------------------------
+# Duplicates across chunks (streaming)
+# --------------------------------------------------
+class _BloomFilter:
+    def __init__(self, bits: int = BLOOM_BITS, hashes: int = BLOOM_HASHES):
+        self.bits = bits
+        self.hashes = hashes
+        self.filter = np.zeros(bits // 8, dtype=np.uint8)
+
+    def _positions(self, hashes: np.ndarray) -> np.ndarray:
+        # Kirsch-Mitzenmacher double hashing from the two 32-bit halves
+        low = hashes & np.uint64(0xFFFFFFFF)
+        high = (hashes >> np.uint64(32)) | np.uint64(1)
+        steps = np.arange(self.hashes, dtype="uint64")
+        return (low[:, None] + steps * high[:, None]) % np.uint64(self.bits)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        positions = self._positions(hashes)
+        bits = (self.filter[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return bits.all(axis=1)
+
+    def add(self, hashes: np.ndarray) -> None:
+        positions = self._positions(hashes).ravel()
+        masks = np.left_shift(np.uint8(1), (positions & np.uint64(7)).astype(np.uint8))
+        # Unbuffered: bytes hit more than once get every bit
+        np.bitwise_or.at(self.filter, positions >> np.uint64(3), masks)
+
+    @property
+    def false_positive_rate(self) -> float:
+        filled = np.unpackbits(self.filter).mean()
+        return float(filled ** self.hashes)
+
+
+class DuplicateCounter:
+    """
+    Duplicate rows over a stream of chunks.
+
+    Exact per-hash counts are kept (and periodically compacted) up to
+    MAX_TRACKED_ROW_HASHES distinct rows; beyond that, rows are checked
+    against a Bloom filter, which can only over-count (by its false
+    positive rate). The most repeated row hashes are kept from the exact
+    phase.
+
+    Rows seen more than once are also fed to a Space-Saving table of
+    EXAMPLE_CANDIDATES hashes that keeps one example row each, so the
+    reported clusters have values even when no copy is in the sample.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self._hashes: List[np.ndarray] = []
+        self._counts: List[np.ndarray] = []
+        self._tracked = 0
+        self._bloom: Optional[_BloomFilter] = None
+        self._bloom_duplicates = 0
+        self._clusters: List = []
+        self._seen: Optional[_BloomFilter] = _BloomFilter(EXAMPLE_BLOOM_BITS, EXAMPLE_BLOOM_HASHES)
+        self._examples: Dict[int, List] = {}   # hash -> [count, rows taken from a chunk, slot]
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if chunk.empty:
+            return
+        hashes = row_hashes(chunk)
+        self.rows += len(hashes)
+
+        if self._bloom is not None:
+            self._update_bloom(hashes, chunk)
+            return
+
+        uniques, first, counts = np.unique(hashes, return_index=True, return_counts=True)
+        seen = self._seen.contains(uniques)
+        self._seen.add(uniques)
+        self._track_examples(chunk, uniques, first, counts, seen)
+
+        self._hashes.append(uniques)
+        self._counts.append(counts)
+        self._tracked += uniques.size
+        if self._tracked > MAX_TRACKED_ROW_HASHES:
+            self._compact()
+            if self._tracked > MAX_TRACKED_ROW_HASHES:
+                self._start_bloom()
+
+    def _track_examples(
+        self,
+        chunk: pd.DataFrame,
+        uniques: np.ndarray,
+        first: np.ndarray,
+        counts: np.ndarray,
+        seen: np.ndarray,
+    ) -> None:
+        """
+        Space-Saving over repeated rows: tracked hashes add this chunk's
+        count; new ones enter above the smallest tracked count and keep
+        the chunk row they were first seen in.
+        """
+        repeated = seen | (counts > 1)
+        if not repeated.any():
+            return
+        uniques, first, counts, seen = uniques[repeated], first[repeated], counts[repeated], seen[repeated]
+
+        table = self._examples
+        tracked = np.isin(uniques, np.fromiter(table, dtype="uint64", count=len(table)))
+        for row_hash, count in zip(uniques[tracked].tolist(), counts[tracked].tolist()):
+            table[row_hash][0] += count
+
+        new = np.flatnonzero(~tracked)
+        if not new.size:
+            return
+        # An earlier copy was seen but not counted; the floor is Space-Saving's overestimate
+        floor = min(entry[0] for entry in table.values()) if len(table) >= EXAMPLE_CANDIDATES else 0
+        estimates = counts[new] + seen[new] + floor
+        order = np.argsort(-estimates, kind="stable")[:EXAMPLE_CANDIDATES]
+        new, estimates = new[order], estimates[order]
+        ranked = sorted(
+            [(entry[0], row_hash) for row_hash, entry in table.items()]
+            + [(int(count), int(uniques[i])) for i, count in zip(new, estimates)],
+            key=lambda item: -item[0],
+        )[:EXAMPLE_CANDIDATES]
+
+        # One take per chunk; values are only built for the reported clusters
+        rows = chunk.iloc[first[new]]
+        slots = {int(uniques[i]): slot for slot, i in enumerate(new)}
+        self._examples = {
+            row_hash: table[row_hash] if row_hash in table else [count, rows, slots[row_hash]]
+            for count, row_hash in ranked
+        }
+
+    def _example(self, row_hash) -> Optional[Tuple[Optional[int], Dict]]:
+        entry = self._examples.get(int(row_hash))
+        if entry is None:
+            return None
+        _, rows, slot = entry
+        return _example_row(rows, slot), _row_values(rows, slot)
+
+    def _compact(self) -> None:
+        hashes = np.concatenate(self._hashes)
+        uniques, inverse = np.unique(hashes, return_inverse=True)
+        counts = np.bincount(inverse, weights=np.concatenate(self._counts), minlength=uniques.size)
+        self._hashes, self._counts = [uniques], [counts.astype("int64")]
+        self._tracked = uniques.size
+
+    def _top(self, uniques: np.ndarray, counts: np.ndarray) -> List:
+        # Equal counts: clusters with an example row first
+        examples = np.fromiter(self._examples, dtype="uint64", count=len(self._examples))
+        top = np.lexsort((~np.isin(uniques, examples), -counts))[:MAX_CLUSTERS]
+        return [
+            (np.uint64(uniques[i]), int(counts[i]), self._example(uniques[i]))
+            for i in top if counts[i] > 1
+        ]
+
+    def _start_bloom(self) -> None:
+        uniques, counts = self._hashes[0], self._counts[0]
+        self._clusters = self._top(uniques, counts)
+        self._bloom_duplicates = int(counts.sum() - uniques.size)
+        self._bloom = _BloomFilter()
+        self._bloom.add(uniques)
+        self._hashes, self._counts, self._tracked = [], [], 0
+        self._seen = None
+
+    def _update_bloom(self, hashes: np.ndarray, chunk: pd.DataFrame) -> None:
+        uniques, first, counts = np.unique(hashes, return_index=True, return_counts=True)
+        seen = self._bloom.contains(uniques)
+        self._bloom_duplicates += len(hashes) - uniques.size + int(seen.sum())
+        self._bloom.add(uniques)
+        self._track_examples(chunk, uniques, first, counts, seen)
+
+    def result(self) -> Dict:
+        """
+        {duplicate_rows, approximate, false_positive_rate, clusters}, where
+        clusters are (row hash, count, example) triples, most repeated
+        first; example is (example_row, values), or None when the row was
+        not tracked.
+        """
+        if self._bloom is not None:
+            return {
+                "duplicate_rows": self._bloom_duplicates,
+                "approximate": True,
+                "false_positive_rate": self._bloom.false_positive_rate,
+                "clusters": self._clusters,
+            }
+
+        if self._hashes:
+            self._compact()
+            uniques, counts = self._hashes[0], self._counts[0]
+        else:
+            uniques, counts = np.array([], dtype="uint64"), np.array([], dtype="int64")
+        return {
+            "duplicate_rows": int(self.rows - uniques.size),
+            "approximate": False,
+            "false_positive_rate": 0.0,
+            "clusters": self._top(uniques, counts),
+        }
+
+
+def apply_exact_duplicates(duplicates: Dict, exact: Dict, df: pd.DataFrame) -> None:
+    """
+    Replace sample duplicate counts and clusters with full-file ones (in
+    place). Cluster values are taken from the sample when the row is in it,
+    otherwise from the example the counter kept while streaming.
+    """
+    duplicates["duplicate_rows"] = exact["duplicate_rows"]
+    duplicates["approximate"] = exact["approximate"]
+    if exact["approximate"]:
+        duplicates["false_positive_rate"] = exact["false_positive_rate"]
+
+    clusters = []
+    if exact["clusters"]:
+        hashes = pd.Series(np.arange(len(df)), index=row_hashes(df))
+        hashes = hashes[~hashes.index.duplicated()]
+        for row_hash, count, example in exact["clusters"]:
+            position = hashes.get(row_hash)
+            if position is not None:
+                example = (_example_row(df, int(position)), _row_values(df, int(position)))
+            example_row, values = example or (None, None)
+            clusters.append({"count": count, "example_row": example_row, "values": values})
+    duplicates["clusters"] = clusters
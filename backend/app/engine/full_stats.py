@@ -0,0 +1,348 @@
+# app/engine/full_stats.py
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.engine.column_summary import IQR_MULTIPLIER
+from app.engine.duplicate_engine import DuplicateCounter
+from app.engine.sketches import HyperLogLog, QuantileSketch, SpaceSaving, hash_values
+from app.engine.time_series_engine import _parse_datetime_column, _to_datetime
+
+MAX_TRACKED_VALUES = 10_000        # distinct values kept per column before giving up
+DATE_PROBE_ROWS = 1_000            # rows of the first chunk used to spot date columns
+NUMERIC_STAT_KEYS = (
+    "min", "max", "mean", "std", "median",
+    "iqr_lower_bound", "iqr_upper_bound", "outlier_count",
+)
+
+
+class FullDataStats:
+    """
+    Exact column statistics accumulated chunk by chunk over every row.
+
+    Fed by the streaming CSV reader before sampling, so counts cover the
+    whole file while distribution metrics stay sample-based. Memory is
+    bounded per column: once a column exceeds MAX_TRACKED_VALUES distinct
+    values its exact counts are folded into a HyperLogLog and a
+    Space-Saving sketch, which keep merging the remaining chunks.
+
+    Whole rows are hashed for full-file duplicate counts
+    (DuplicateCounter). Numeric columns also feed a quantile sketch. Its IQR bounds drive a
+    second pass (`second_pass_columns` / `second_pass`) that counts
+    outliers over every row.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.rows = 0
+        self._columns: Dict[str, Dict] = {}
+        self._column_order: List[str] = []
+        self._outlier_bounds: Optional[Dict[str, tuple]] = None
+        self._date_columns: Optional[Dict[str, Optional[str]]] = None   # column -> parse format
+        self._date_counts: Dict[str, pd.Series] = {}      # column -> rows per hour
+        self._duplicates = DuplicateCounter()
+
+    # --------------------------------------------------
+    # Accumulation
+    # --------------------------------------------------
+    def update(self, chunk: pd.DataFrame) -> None:
+        if chunk.empty:
+            return
+
+        self.rows += len(chunk)
+        if not self._column_order:
+            self._column_order = list(chunk.columns)
+
+        if self._date_columns is None:
+            self._date_columns = self._detect_date_columns(chunk)
+
+        for col in chunk.columns:
+            self._update_column(col, chunk[col])
+
+        for col, fmt in self._date_columns.items():
+            self._update_date_counts(col, chunk[col], fmt)
+
+        self._duplicates.update(chunk)
+
+    def _column_state(self, col: str) -> Dict:
+        if col not in self._columns:
+            self._columns[col] = {
+                "null_count": 0,
+                "values": pd.Series(dtype="int64"),
+                "sketch": None,
+                "numeric": {
+                    "count": 0, "mean": 0.0, "m2": 0.0, "min": None, "max": None,
+                    "quantiles": QuantileSketch(), "outlier_count": 0,
+                },
+            }
+        return self._columns[col]
+
+    def _update_column(self, col: str, series: pd.Series) -> None:
+        state = self._column_state(col)
+        state["null_count"] += int(series.isna().sum())
+
+        # Exact value counts while the column stays low-cardinality, sketches after
+        if state["values"] is not None:
+            merged = state["values"].add(series.value_counts(dropna=True), fill_value=0)
+            if len(merged) <= MAX_TRACKED_VALUES:
+                state["values"] = merged
+            else:
+                state["sketch"] = self._start_sketch(merged.astype("int64"))
+                state["values"] = None
+        else:
+            distinct, heavy = state["sketch"]
+            distinct.update(hash_values(series))
+            heavy.update(series)
+
+        # Welford / Chan merge of running moments
+        numeric = state["numeric"]
+        if numeric is None:
+            return
+        if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            state["numeric"] = None
+            return
+
+        values = series.dropna().to_numpy(dtype="float64")
+        if values.size == 0:
+            return
+
+        n_a, n_b = numeric["count"], values.size
+        mean_b = float(values.mean())
+        m2_b = float(((values - mean_b) ** 2).sum())
+        n = n_a + n_b
+        delta = mean_b - numeric["mean"]
+
+        numeric["mean"] += delta * n_b / n
+        numeric["m2"] += m2_b + delta * delta * n_a * n_b / n
+        numeric["count"] = n
+
+        chunk_min, chunk_max = float(values.min()), float(values.max())
+        numeric["min"] = chunk_min if numeric["min"] is None else min(numeric["min"], chunk_min)
+        numeric["max"] = chunk_max if numeric["max"] is None else max(numeric["max"], chunk_max)
+        numeric["quantiles"].update(values)
+
+    @staticmethod
+    def _start_sketch(counts: pd.Series):
+        """
+        Seed both sketches from exact counts; hashing the distinct values
+        once is equivalent to hashing every row seen so far.
+        """
+        distinct = HyperLogLog()
+        distinct.update(hash_values(counts.index.to_series()))
+        heavy = SpaceSaving()
+        heavy.merge_counts(counts.sort_values(ascending=False, kind="stable"))
+        return distinct, heavy
+
+    def _detect_date_columns(self, chunk: pd.DataFrame) -> Dict[str, Optional[str]]:
+        probe = chunk.head(DATE_PROBE_ROWS)
+        date_columns = {}
+        for col in probe.columns:
+            series = probe[col]
+            if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+                continue
+            parsed, fmt = _parse_datetime_column(series)
+            if parsed is not None:
+                date_columns[col] = fmt
+        return date_columns
+
+    def _update_date_counts(self, col: str, series: pd.Series, fmt: Optional[str]) -> None:
+        parsed = _to_datetime(series, fmt)
+        if parsed.dt.tz is not None:
+            parsed = parsed.dt.tz_localize(None)   # wall-clock hours, no DST ambiguity
+        counts = parsed.dt.floor("h").value_counts(dropna=True)
+        previous = self._date_counts.get(col)
+        self._date_counts[col] = counts if previous is None else previous.add(counts, fill_value=0)
+
+    # --------------------------------------------------
+    # Second pass: outliers against full-data IQR bounds
+    # --------------------------------------------------
+    @staticmethod
+    def _quartiles(numeric: Dict) -> Dict:
+        q1, median, q3 = numeric["quantiles"].quantiles([0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        return {
+            "q1": float(q1),
+            "median": float(median),
+            "q3": float(q3),
+            "iqr_lower_bound": float(q1 - IQR_MULTIPLIER * iqr),
+            "iqr_upper_bound": float(q3 + IQR_MULTIPLIER * iqr),
+        }
+
+    def second_pass_columns(self) -> List[int]:
+        """
+        Positions of the numeric columns to re-read; freezes their bounds.
+        """
+        self._outlier_bounds = {}
+        positions = []
+        for position, col in enumerate(self._column_order):
+            numeric = self._columns[col]["numeric"]
+            if numeric is None or numeric["count"] == 0:
+                continue
+            quartiles = self._quartiles(numeric)
+            self._outlier_bounds[col] = (quartiles["iqr_lower_bound"], quartiles["iqr_upper_bound"])
+            numeric["outlier_count"] = 0
+            positions.append(position)
+        return positions
+
+    def second_pass(self, chunk: pd.DataFrame) -> None:
+        """
+        Count outliers in a chunk holding exactly the second_pass_columns,
+        in file order.
+        """
+        columns = list(self._outlier_bounds)
+        if chunk.empty or not columns:
+            return
+
+        lower = np.array([self._outlier_bounds[col][0] for col in columns])
+        upper = np.array([self._outlier_bounds[col][1] for col in columns])
+        block = chunk.to_numpy(dtype="float64", na_value=np.nan)
+        counts = ((block < lower) | (block > upper)).sum(axis=0)
+
+        for col, count in zip(columns, counts):
+            self._columns[col]["numeric"]["outlier_count"] += int(count)
+
+    # --------------------------------------------------
+    # Results
+    # --------------------------------------------------
+    def result(self) -> Dict:
+        columns = {}
+        for col, state in self._columns.items():
+            values = state["values"]
+            numeric = state["numeric"]
+
+            unique_count, approximate = None, None
+            if values is not None:
+                unique_count = int(len(values))
+                values = values.astype("int64").sort_values(ascending=False, kind="stable")
+            else:
+                distinct, heavy = state["sketch"]
+                unique_count = distinct.estimate()
+                values = heavy.top(heavy.k)
+                approximate = {
+                    "unique_count_rse": distinct.relative_error,
+                    "top_count_max_error": heavy.max_error(),
+                }
+
+            numeric_stats = None
+            if numeric is not None and numeric["count"] > 0:
+                numeric_stats = {
+                    "min": numeric["min"],
+                    "max": numeric["max"],
+                    "mean": numeric["mean"],
+                    "std": float(np.sqrt(numeric["m2"] / numeric["count"])),
+                    **self._quartiles(numeric),
+                    "outlier_count": (
+                        numeric["outlier_count"]
+                        if self._outlier_bounds is not None and col in self._outlier_bounds
+                        else None
+                    ),
+                }
+                if not numeric["quantiles"].is_exact:
+                    approximate = {**(approximate or {}), "quantile_rank_error": numeric["quantiles"].rank_error}
+
+            columns[col] = {
+                "null_count": state["null_count"],
+                "unique_count": unique_count,
+                "value_counts": values,
+                "approximate": approximate,
+                "numeric": numeric_stats,
+            }
+
+        duplicates = self._duplicates.result()
+
+        return {
+            "rows": self.rows,
+            "duplicate_rows": duplicates["duplicate_rows"],
+            "duplicates": duplicates,
+            "missing_cells": sum(c["null_count"] for c in columns.values()),
+            "columns": columns,
+            "date_counts": {
+                col: counts.astype("int64").sort_index()
+                for col, counts in self._date_counts.items()
+            },
+        }
+
+
+def apply_exact_summaries(summaries: Dict[str, Dict], exact: Dict) -> None:
+    """
+    Point numeric column summaries at full-data moments, quartiles and
+    outlier counts (in place), so the validator and profiler judge
+    outliers over every row rather than the sample.
+    """
+    rows = exact["rows"]
+    for col, summary in summaries.items():
+        col_stats = exact["columns"].get(col)
+        if col_stats is None or summary["numeric"] is None or not col_stats["numeric"]:
+            continue
+        if col_stats["numeric"]["outlier_count"] is None:
+            continue
+
+        summary["rows"] = rows
+        summary["null_count"] = col_stats["null_count"]
+        summary["null_ratio"] = col_stats["null_count"] / rows if rows else 0.0
+        summary["numeric"] = {
+            key: value for key, value in col_stats["numeric"].items() if key != "std"
+        }
+        summary["approximate"] = col_stats["approximate"]
+
+
+def apply_exact_stats(
+    column_profiles: List[Dict],
+    dataset_profile: Dict,
+    exact: Dict,
+) -> None:
+    """
+    Overwrite sample-based counts with exact full-data values (in place).
+    Median and IQR bounds come from the quantile sketch; entropy remains
+    sample-based. Sketch-based values carry their error bounds.
+    """
+    rows = exact["rows"]
+    if rows == 0:
+        return
+
+    for profile in column_profiles:
+        col_stats = exact["columns"].get(profile["name"])
+        if col_stats is None:
+            continue
+
+        metrics = profile["metrics"]
+        metrics["null_count"] = col_stats["null_count"]
+        metrics["null_percentage"] = col_stats["null_count"] / rows * 100
+        metrics["unique_count"] = col_stats["unique_count"]
+
+        if col_stats["approximate"]:
+            metrics["stats"] = metrics["stats"] or {}
+            metrics["stats"]["approximate"] = col_stats["approximate"]
+        elif metrics["stats"]:
+            metrics["stats"].pop("approximate", None)   # sample sketch superseded by exact counts
+            metrics["stats"] = metrics["stats"] or None
+
+        stats = metrics.get("stats")
+        if not stats:
+            continue
+
+        if metrics["inferred_type"] == "number" and col_stats["numeric"]:
+            stats.update({
+                key: col_stats["numeric"][key]
+                for key in NUMERIC_STAT_KEYS
+                if col_stats["numeric"][key] is not None
+            })
+
+        value_counts = col_stats["value_counts"]
+        if metrics["inferred_type"] == "categorical" and value_counts is not None and len(value_counts):
+            stats["top_values"] = [
+                {"value": value, "count": int(count)}
+                for value, count in value_counts.head(5).items()
+            ]
+            non_null = rows - col_stats["null_count"]
+            stats["dominant_ratio"] = float(value_counts.iloc[0] / non_null) if non_null else 0.0
+
+    dataset_profile["missing_cells_percentage"] = float(
+        exact["missing_cells"] / (rows * max(len(exact["columns"]), 1)) * 100
+    )
+    if exact["duplicate_rows"] is not None:
+        dataset_profile["duplicate_rows"] = exact["duplicate_rows"]
+    dataset_profile["exact_counts"] = True
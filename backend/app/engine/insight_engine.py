@@ -69,6 +69,7 @@ def generate_insights(
                 "evidence": sig.get("evidence", []),
                 "impact": sig.get("impact"),
                 "recommendation": "Investigate root causes for temporal anomalies.",
+                "anomaly_score": sig.get("score"),
             })
 
     # --- Attach confidence (ADD-ONLY) ---
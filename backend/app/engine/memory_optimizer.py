@@ -0,0 +1,74 @@
+# app/engine/memory_optimizer.py
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+CATEGORY_RATIO = 0.2   # same low-cardinality cut-off as type_inference
+
+
+def _frame_bytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True, index=False).sum())
+
+
+def _downcast_float(series: pd.Series) -> pd.Series:
+    """
+    float64 -> float32 only when every value survives the round trip.
+    """
+    values = series.to_numpy()
+    narrow = values.astype("float32")
+    if np.array_equal(narrow.astype("float64"), values, equal_nan=True):
+        return pd.Series(narrow, index=series.index, name=series.name)
+    return series
+
+
+def optimize_frame(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Shrink a parsed frame before profiling:
+    - integers downcast to the smallest width holding their range
+    - floats downcast to float32 when lossless
+    - low-cardinality text columns converted to `category`
+
+    Arrow-backed columns are already compact and left untouched.
+    Returns: (df, {"bytes_before", "bytes_after"})
+    """
+    bytes_before = _frame_bytes(df)
+    rows = max(len(df), 1)
+    optimized = {}
+
+    for col in df.columns:
+        series = df[col]
+        dtype = series.dtype
+
+        if isinstance(dtype, pd.ArrowDtype):
+            continue
+
+        if pd.api.types.is_bool_dtype(dtype):
+            continue
+
+        if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+            kind = "unsigned" if len(series) and series.min() >= 0 else "integer"
+            optimized[col] = pd.to_numeric(series, downcast=kind)
+
+        elif dtype == np.float64:
+            optimized[col] = _downcast_float(series)
+
+        elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            # One factorize both decides and builds the categorical
+            codes, uniques = pd.factorize(series, use_na_sentinel=True)
+            if len(uniques) / rows < CATEGORY_RATIO:
+                optimized[col] = pd.Series(
+                    pd.Categorical.from_codes(codes, categories=uniques),
+                    index=series.index,
+                    name=series.name,
+                )
+
+    if optimized:
+        df = df.copy(deep=False)
+        for col, values in optimized.items():
+            df[col] = values
+
+    return df, {
+        "bytes_before": bytes_before,
+        "bytes_after": _frame_bytes(df),
+    }
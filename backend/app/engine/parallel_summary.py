@@ -0,0 +1,173 @@
+# app/engine/parallel_summary.py
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pc = None
+
+PROFILE_WORKERS = int(os.getenv("PROFILE_WORKERS", "0"))   # 0 disables the pool
+PARALLEL_MIN_CELLS = 2_000_000   # below this, process start-up costs more than it saves
+SHARED_MEMORY_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+_executor_users: Dict[ProcessPoolExecutor, int] = {}   # requests currently submitting to each pool
+_executor_lock = threading.Lock()
+
+
+@contextmanager
+def _borrow_executor(workers: int) -> Iterator[ProcessPoolExecutor]:
+    """
+    One long-lived pool per process, shared by the ingestion threads.
+    `spawn` keeps workers safe to start from a threaded server process.
+
+    A pool replaced by a different worker count while requests still use
+    it is shut down by the last of them, never under a running request.
+    """
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            if _executor is not None and _executor not in _executor_users:
+                _executor.shutdown(wait=False)
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _executor_workers = workers
+        executor = _executor
+        _executor_users[executor] = _executor_users.get(executor, 0) + 1
+
+    try:
+        yield executor
+    finally:
+        with _executor_lock:
+            _executor_users[executor] -= 1
+            if not _executor_users[executor]:
+                del _executor_users[executor]
+                if executor is not _executor:
+                    executor.shutdown(wait=False)
+
+
+def _sorted_counts(values, counts: np.ndarray) -> pd.Series:
+    order = np.argsort(-counts, kind="stable")   # ties keep first-seen order
+    return pd.Series(counts[order], index=pd.Index(values).take(order))
+
+
+# --------------------------------------------------
+# Worker entry points (must stay importable top-level functions)
+# --------------------------------------------------
+def _arrow_value_counts(path: str, columns: List[str]) -> Dict[str, pd.Series]:
+    """
+    Memory-map the shared Arrow IPC file and count values without
+    copying column buffers into the worker.
+    """
+    with pa.memory_map(path, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+        results = {}
+        for col in columns:
+            counted = pc.value_counts(table.column(col))
+            values = counted.field("values")
+            counts = counted.field("counts").to_numpy(zero_copy_only=False)
+            keep = values.is_valid().to_numpy(zero_copy_only=False)
+            results[col] = _sorted_counts(
+                values.filter(pa.array(keep)).to_pylist(),
+                counts[keep],
+            )
+        return results
+
+
+def _pandas_value_counts(frame: pd.DataFrame) -> Dict[str, pd.Series]:
+    from app.engine.column_summary import _value_counts
+    return {col: _value_counts(frame[col]) for col in frame.columns}
+
+
+# --------------------------------------------------
+# Driver
+# --------------------------------------------------
+def _split(columns: List[str], parts: int) -> List[List[str]]:
+    return [columns[i::parts] for i in range(parts) if columns[i::parts]]
+
+
+def _arrow_arrays(df: pd.DataFrame, columns: List[str]) -> Dict[str, "pa.Array"]:
+    """
+    Convert columns to Arrow strings once; mixed-type object columns
+    that do not convert stay on the pickled fallback path.
+    """
+    if pa is None:
+        return {}
+    arrays = {}
+    for col in columns:
+        try:
+            arrays[col] = pa.array(df[col], type=pa.string(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            continue
+    return arrays
+
+
+def parallel_value_counts(
+    df: pd.DataFrame,
+    columns: List[str],
+    workers: int,
+) -> Dict[str, pd.Series]:
+    """
+    Value counts for `columns` split across a process pool.
+
+    With pyarrow installed the columns are written once to an Arrow IPC
+    file in shared memory that every worker memory-maps; otherwise each
+    task receives only its own slice of columns.
+    """
+    with _borrow_executor(workers) as executor:
+        return _submit_value_counts(executor, df, columns, workers)
+
+
+def _submit_value_counts(
+    executor: ProcessPoolExecutor,
+    df: pd.DataFrame,
+    columns: List[str],
+    workers: int,
+) -> Dict[str, pd.Series]:
+    arrays = _arrow_arrays(df, columns)
+    arrow_cols = list(arrays)
+    pickled_cols = [col for col in columns if col not in arrays]
+
+    results: Dict[str, pd.Series] = {}
+    futures = []
+    path = None
+
+    try:
+        if arrow_cols:
+            table = pa.Table.from_arrays(list(arrays.values()), names=arrow_cols)
+            with tempfile.NamedTemporaryFile(
+                dir=SHARED_MEMORY_DIR, suffix=".arrow", delete=False
+            ) as handle:
+                path = handle.name
+            with pa.OSFile(path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            del table, arrays
+
+            for part in _split(arrow_cols, workers):
+                futures.append(executor.submit(_arrow_value_counts, path, part))
+
+        for part in _split(pickled_cols, workers):
+            futures.append(executor.submit(_pandas_value_counts, df[part]))
+
+        for future in futures:
+            results.update(future.result())
+    finally:
+        if path is not None:
+            os.unlink(path)
+
+    return results
@@ -1,95 +1,65 @@
 # app/engine/profiler.py
-import pandas as pd
-import numpy as np
-from math import log2
-
-
-def _iqr_outliers(series: pd.Series):
-    clean = series.dropna()
-
-    if clean.empty:
-        return {
-            "count": 0,
-            "lower_bound": None,
-            "upper_bound": None,
-        }
-
-    q1 = clean.quantile(0.25)
-    q3 = clean.quantile(0.75)
-    iqr = q3 - q1
-
-    lower = q1 - 1.5 * iqr
-    upper = q3 + 1.5 * iqr
+from typing import Dict, Optional
 
-    outliers = clean[(clean < lower) | (clean > upper)]
-
-    return {
-        "count": int(outliers.count()),
-        "lower_bound": float(lower),
-        "upper_bound": float(upper),
-    }
-
-
-def _entropy(series: pd.Series) -> float:
-    counts = series.value_counts(dropna=True)
-    total = counts.sum()
-
-    entropy = 0.0
-    for count in counts:
-        p = count / total
-        entropy -= p * log2(p)
+import pandas as pd
 
-    return float(entropy)
+from app.engine.column_summary import summarize_columns, entropy_from_counts
 
 
-def profile_columns(df: pd.DataFrame, types: dict):
+def profile_columns(
+    df: pd.DataFrame,
+    types: dict,
+    summaries: Optional[Dict[str, Dict]] = None,
+):
+    summaries = summaries or summarize_columns(df)
     profiles = []
 
     for col in df.columns:
-        series = df[col]
+        summary = summaries[col]
 
         metrics = {
             "inferred_type": types[col],
-            "null_count": int(series.isna().sum()),
-            "null_percentage": float(series.isna().mean() * 100),
-            "unique_count": int(series.nunique()),
+            "null_count": summary["null_count"],
+            "null_percentage": float(summary["null_ratio"] * 100),
+            "unique_count": summary["unique_count"],
             "stats": None,
         }
 
         # NUMERIC COLUMNS
-        if types[col] == "number":
-            outlier_info = _iqr_outliers(series)
+        if types[col] == "number" and summary["numeric"] is not None:
+            numeric = summary["numeric"]
 
             metrics["stats"] = {
-                "min": float(series.min()),
-                "max": float(series.max()),
-                "mean": float(series.mean()),
-                "median": float(series.median()),
-                "outlier_count": outlier_info["count"],
-                "iqr_lower_bound": outlier_info["lower_bound"],
-                "iqr_upper_bound": outlier_info["upper_bound"],
+                "min": numeric["min"],
+                "max": numeric["max"],
+                "mean": numeric["mean"],
+                "median": numeric["median"],
+                "outlier_count": numeric["outlier_count"],
+                "iqr_lower_bound": numeric["iqr_lower_bound"],
+                "iqr_upper_bound": numeric["iqr_upper_bound"],
             }
 
         # CATEGORICAL COLUMNS
         if types[col] == "categorical":
-            value_counts = series.value_counts(dropna=True)
-            total = int(value_counts.sum())
-
-            top_values = (
-                value_counts.head(5)
-                .reset_index()
-                .rename(columns={"index": "value", col: "count"})
-                .to_dict(orient="records")
-            )
+            value_counts = summary["value_counts"]
+            total = summary["rows"] - summary["null_count"]
 
-            entropy_score = _entropy(series)
+            top_values = [
+                {"value": value, "count": int(count)}
+                for value, count in value_counts.head(5).items()
+            ]
 
             metrics["stats"] = {
                 "top_values": top_values,
-                "entropy": entropy_score,
+                "entropy": entropy_from_counts(value_counts, total, summary["unique_count"]),
                 "dominant_ratio": float(value_counts.iloc[0] / total) if total > 0 else 0.0,
             }
 
+        # Sketch-based counts carry their error bounds
+        if summary.get("approximate"):
+            metrics["stats"] = metrics["stats"] or {}
+            metrics["stats"]["approximate"] = summary["approximate"]
+
         profiles.append({
             "name": col,
             "metrics": metrics,
@@ -0,0 +1,218 @@
+# app/engine/sketches.py
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+PROFILE_SKETCHES = os.getenv("PROFILE_SKETCHES", "0") == "1"   # sketch mode for text columns
+HLL_PRECISION = 14          # 16,384 registers, ~0.8% relative standard error
+TOP_K = 64                  # counters kept by Space-Saving
+QUANTILE_K = 1024           # KLL top-level capacity, ~0.3% rank error
+QUANTILE_SEED = 0
+SKETCH_BLOCK_ROWS = 16_384  # rows folded into a sketch at a time
+
+
+def hash_values(series: pd.Series) -> np.ndarray:
+    """
+    Stable 64-bit hashes of the non-null values. Numerics are hashed as
+    float64 so int and float chunks of the same column agree.
+    """
+    values = series.dropna()
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        values = values.astype("float64")
+    # categorize=False: no factorize, so no table of distinct values is built
+    return pd.util.hash_pandas_object(values, index=False, categorize=False).to_numpy()
+
+
+def _leading_zeros(words: np.ndarray) -> np.ndarray:
+    """
+    Vectorized count of leading zero bits in uint64 words.
+    """
+    zeros = np.zeros(words.shape, dtype=np.uint8)
+    shifted = words.copy()
+    for width in (32, 16, 8, 4, 2, 1):
+        top_clear = (shifted >> np.uint64(64 - width)) == 0
+        zeros[top_clear] += width
+        shifted[top_clear] <<= np.uint64(width)
+    zeros[words == 0] = 64
+    return zeros
+
+
+class HyperLogLog:
+    """
+    Mergeable distinct-count estimator over 64-bit hashes.
+    """
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        return float(1.04 / np.sqrt(len(self.registers)))
+
+    def update(self, hashes: np.ndarray) -> None:
+        if hashes.size == 0:
+            return
+        p = np.uint64(self.precision)
+        index = (hashes >> (np.uint64(64) - p)).astype(np.int64)
+        rank = _leading_zeros(hashes << p) + 1
+        np.minimum(rank, 64 - self.precision + 1, out=rank)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return int(round(m * np.log(m / zeros)))   # linear counting for small sets
+        return int(round(raw))
+
+
+class SpaceSaving:
+    """
+    Mergeable heavy-hitter summary keeping at most `k` counters.
+
+    Counts are over-estimates by at most their `errors` entry; any value
+    missing from the summary occurred at most `min_count` times.
+    """
+
+    def __init__(self, k: int = TOP_K):
+        self.k = k
+        self.counts = pd.Series(dtype="int64")
+        self.errors = pd.Series(dtype="int64")
+        self.total = 0
+
+    @property
+    def min_count(self) -> int:
+        return int(self.counts.min()) if len(self.counts) >= self.k else 0
+
+    def update(self, series: pd.Series) -> None:
+        for start in range(0, len(series), SKETCH_BLOCK_ROWS):
+            self.merge_counts(series.iloc[start:start + SKETCH_BLOCK_ROWS].value_counts(dropna=True))
+
+    def merge_counts(self, counts: pd.Series) -> None:
+        """
+        Fold exact counts sorted descending (e.g. one block's value_counts)
+        into the summary. Only the top `k` are merged; the first dropped
+        count bounds every value left out.
+        """
+        total = int(counts.sum())
+        floor = int(counts.iloc[self.k]) if len(counts) > self.k else 0
+        counts = counts.head(self.k)
+        errors = pd.Series(0, index=counts.index, dtype="int64")
+        self._merge_counts(counts, errors, floor, total)
+
+    def merge(self, other: "SpaceSaving") -> None:
+        self._merge_counts(other.counts, other.errors, other.min_count, other.total)
+
+    def _merge_counts(self, counts: pd.Series, errors: pd.Series, other_floor: int, total: int) -> None:
+        if counts.empty:
+            return
+
+        floor = self.min_count
+        index = self.counts.index.union(counts.index, sort=False)
+        mine = self.counts.reindex(index, fill_value=floor)
+        theirs = counts.reindex(index, fill_value=other_floor)
+        mine_err = self.errors.reindex(index, fill_value=floor)
+        theirs_err = errors.reindex(index, fill_value=other_floor)
+
+        merged = (mine + theirs).sort_values(ascending=False, kind="stable").head(self.k)
+        self.counts = merged.astype("int64")
+        self.errors = (mine_err + theirs_err).reindex(merged.index).astype("int64")
+        self.total += total
+
+    def top(self, n: int) -> pd.Series:
+        return self.counts.head(n)
+
+    def max_error(self, n: Optional[int] = None) -> int:
+        errors = self.errors.reindex(self.top(n or self.k).index)
+        return int(errors.max()) if len(errors) else 0
+
+
+class QuantileSketch:
+    """
+    Mergeable KLL quantile sketch over float values.
+
+    Level h holds items of weight 2**h. A level over capacity is sorted
+    and every other item (random offset) is promoted to the next level,
+    so memory stays O(k log n) whatever the stream length. While nothing
+    has been compacted the quantiles are exact.
+    """
+
+    def __init__(self, k: int = QUANTILE_K, seed: int = QUANTILE_SEED):
+        self.k = k
+        self.levels = [np.empty(0, dtype="float64")]
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def is_exact(self) -> bool:
+        return len(self.levels) == 1
+
+    @property
+    def rank_error(self) -> float:
+        # Empirical KLL bound (99% confidence) as published with DataSketches
+        return 0.0 if self.is_exact else float(2.296 / self.k ** 0.9723)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values: np.ndarray) -> None:
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += values.size
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(items.copy())
+            else:
+                self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) <= self._capacity(level):
+                level += 1
+                continue
+
+            items = np.sort(items)
+            even = len(items) - len(items) % 2
+            promoted = items[self._rng.integers(2):even:2]
+            self.levels[level] = items[even:]     # odd leftover stays at weight 2**level
+
+            if level + 1 == len(self.levels):
+                self.levels.append(promoted)
+            else:
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level = 0   # a new level shrinks every capacity below it
+
+    def quantiles(self, qs) -> np.ndarray:
+        qs = np.asarray(qs, dtype="float64")
+        if self.count == 0:
+            return np.full(qs.shape, np.nan)
+        if self.is_exact:
+            return np.quantile(self.levels[0], qs)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)
+        ])
+        order = np.argsort(items, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        positions = np.searchsorted(cumulative, qs * cumulative[-1], side="left")
+        return items[order][np.minimum(positions, len(items) - 1)]
@@ -1,10 +1,116 @@
 # app/engine/time_series_engine.py
 
-from typing import Dict, List, Optional
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+from app.engine.anomaly_engine import detect_anomalies
 
 DATE_PARSE_THRESHOLD = 0.7   # 70% must parse to accept as datetime
-DROP_SPIKE_THRESHOLD = 0.3   # 30% change triggers risk
+MAX_METRICS = 8              # numeric columns aggregated per period
+METRIC_MAX_NULL_PERCENTAGE = 50
+
+FREQUENCIES = ("hourly", "daily", "weekly", "monthly", "quarterly")   # finest first
+MIN_PERIODS = 3                # fewer periods than this cannot show a trend
+FILL_RATIO_TARGET = 0.8        # share of periods in the span that must be observed
+MAX_PRIMARY_PERIODS = 730      # finer levels beyond this are left for zooming
+MAX_LEVEL_PERIODS = 10_000     # levels longer than this are not returned
+MAX_GAPS = 50                  # longest gap ranges returned per signal
+BUSINESS_DAY_MIN_PERIODS = 10  # observed days before a weekday-only series counts business days
+
+DATE_PROBE_SIZE = 300        # values probed per candidate column
+DATE_PROBE_SEED = 0
+
+# Tried in order on the probe; ISO8601 covers date, datetime, 'T', fractions and offsets
+DATE_FORMATS = (
+    "ISO8601",
+    "%m/%d/%Y", "%d/%m/%Y", "%m/%d/%Y %H:%M", "%d/%m/%Y %H:%M",
+    "%m/%d/%Y %H:%M:%S", "%d/%m/%Y %H:%M:%S",
+    "%d-%m-%Y", "%d.%m.%Y", "%Y/%m/%d", "%Y/%m/%d %H:%M:%S",
+    "%d %b %Y", "%b %d %Y", "%b %d, %Y", "%d %B %Y", "%B %d, %Y",
+    "%m/%d/%y", "%d/%m/%y",
+)
+
+# Cheap shape check: numeric date parts, or a month name next to numbers
+DATE_HINT = re.compile(
+    r"\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}"
+    r"|\d{4}-\d{2}"
+    r"|\d{1,2}\s+[A-Za-z]{3,9}\.?,?\s+\d{2,4}"
+    r"|[A-Za-z]{3,9}\.?\s+\d{1,2},?\s+\d{2,4}"
+)
+
+
+def _to_datetime(series: pd.Series, format: Optional[str] = None) -> pd.Series:
+    """
+    Coerce to NumPy-backed datetimes; Arrow timestamps (pyarrow engine)
+    are converted so .dt.to_period / strftime behave the same.
+    Categorical columns parse each distinct category once.
+    `format` (from _probe_datetime_format) skips per-value inference.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = _to_datetime(series.cat.categories.to_series(index=None), format)
+        values = categories.array.take(series.cat.codes.to_numpy(), allow_fill=True)
+        return pd.Series(values, index=series.index, name=series.name)
+
+    parsed = pd.to_datetime(series, errors="coerce", format=format)
+    if isinstance(parsed.dtype, pd.ArrowDtype):
+        parsed = parsed.astype("datetime64[ns]")
+    return parsed
+
+
+def _probe_datetime_format(series: pd.Series) -> Optional[str]:
+    """
+    Pick a parse format from a small random probe of the column, or None
+    when it does not look like dates.
+
+    The probe (nulls included, so the ratio matches the full-column
+    threshold) is regex-prefiltered first; free text is rejected without
+    any datetime parsing. Survivors are tried against DATE_FORMATS and
+    pandas' guess for the first value; "mixed" is the last resort.
+    """
+    probe = series
+    if len(series) > DATE_PROBE_SIZE:
+        probe = series.sample(n=DATE_PROBE_SIZE, random_state=DATE_PROBE_SEED)
+    probe = probe.astype(object).where(probe.notna(), None)
+    if len(probe) == 0:
+        return None
+
+    texts = [value.strip() for value in probe if isinstance(value, str)]
+    hinted = [text for text in texts if DATE_HINT.search(text)]
+    if len(hinted) / len(probe) < DATE_PARSE_THRESHOLD:
+        return None
+
+    candidates = list(DATE_FORMATS)
+    guessed = guess_datetime_format(hinted[0])
+    if guessed and guessed not in candidates:
+        candidates.append(guessed)
+    candidates.append("mixed")
+
+    sample = pd.Series(texts, dtype=object)
+    for fmt in candidates:
+        parsed = pd.to_datetime(sample, errors="coerce", format=fmt)
+        if parsed.notna().sum() / len(probe) >= DATE_PARSE_THRESHOLD:
+            return fmt
+    return None
+
+
+def _parse_datetime_column(series: pd.Series) -> Tuple[Optional[pd.Series], Optional[str]]:
+    """
+    Probe, then parse the whole column once with the chosen format.
+    Returns (parsed, format); parsed is None when the column is rejected.
+    """
+    fmt = None
+    if not pd.api.types.is_datetime64_any_dtype(series.dtype):
+        fmt = _probe_datetime_format(series)
+        if fmt is None:
+            return None, None
+
+    parsed = _to_datetime(series, fmt)
+    if parsed.notna().mean() >= DATE_PARSE_THRESHOLD:
+        return parsed, fmt
+    return None, None
 
 
 def _try_parse_datetime(series: pd.Series) -> Optional[pd.Series]:
@@ -12,27 +118,327 @@ def _try_parse_datetime(series: pd.Series) -> Optional[pd.Series]:
     Attempt to safely parse a column into datetime.
     Only accept if parsing success rate crosses threshold.
     """
-    parsed = pd.to_datetime(
-        series,
-        errors="coerce",
-        # NOTE:
-        # infer_datetime_format was removed in pandas >= 2.0
-        # Modern pandas infers formats automatically (same behavior)
-    )
-    success_ratio = parsed.notna().mean()
-    if success_ratio >= DATE_PARSE_THRESHOLD:
-        return parsed
-    return None
+    return _parse_datetime_column(series)[0]
+
+
+def _row_hours(parsed: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hour ordinals of the parsed dates (wall-clock time for tz-aware
+    columns) plus the non-null row mask, without touching the rest of
+    the frame. Hours stay in row order so metrics can be aligned.
+    """
+    if getattr(parsed.dt, "tz", None) is not None:
+        parsed = parsed.dt.tz_localize(None)
+    mask = parsed.notna().to_numpy()
+    values = parsed.to_numpy(dtype="datetime64[ns]")[mask]
+    return mask, values.astype("datetime64[h]").astype("int64")
+
+
+def _count_sorted(codes: np.ndarray, weights: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run-length totals of sorted period codes: (unique codes, counts).
+    """
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    if weights is None:
+        totals = np.diff(np.r_[starts, len(codes)])
+    else:
+        totals = np.add.reduceat(weights, starts)
+    return codes[starts], totals
+
+
+def _level_codes(hours: np.ndarray, frequency: str) -> np.ndarray:
+    """
+    Map hour ordinals to period ordinals. Every mapping is monotonic, so
+    sorted hours give sorted codes. Weeks start on Monday.
+    """
+    if frequency == "hourly":
+        return hours
+    days = np.floor_divide(hours, 24)
+    if frequency == "daily":
+        return days
+    if frequency == "weekly":
+        return np.floor_divide(days + 3, 7)   # 1970-01-01 was a Thursday
+    months = days.astype("datetime64[D]").astype("datetime64[M]").astype("int64")
+    if frequency == "monthly":
+        return months
+    return np.floor_divide(months, 3)
+
+
+def _level_labels(codes: np.ndarray, frequency: str) -> List[str]:
+    if frequency == "hourly":
+        labels = np.datetime_as_string(codes.astype("datetime64[h]").astype("datetime64[m]"))
+        return [label.replace("T", " ") for label in labels]
+    if frequency == "daily":
+        return np.datetime_as_string(codes.astype("datetime64[D]")).tolist()
+    if frequency == "weekly":
+        return np.datetime_as_string((codes * 7 - 3).astype("datetime64[D]")).tolist()
+    if frequency == "monthly":
+        return np.datetime_as_string(codes.astype("datetime64[M]")).tolist()
+    return [f"{1970 + q // 4}Q{q % 4 + 1}" for q in codes.tolist()]
+
+
+def _hour_counts(hours: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The single pass over sorted timestamps: counts per hour ordinal.
+    """
+    return _count_sorted(np.sort(hours))
+
+
+def _exact_hour_counts(hour_counts: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact full-data per-hour counts (FullDataStats) as hour ordinals.
+    """
+    hours = hour_counts.sort_index()
+    if getattr(hours.index, "tz", None) is not None:
+        hours.index = hours.index.tz_localize(None)
+    codes = hours.index.to_numpy(dtype="datetime64[ns]").astype("datetime64[h]").astype("int64")
+    return _count_sorted(codes, hours.to_numpy(dtype="int64"))
+
+
+def _weekdays_only(days: np.ndarray) -> bool:
+    return len(days) >= BUSINESS_DAY_MIN_PERIODS and bool(((days + 3) % 7 < 5).all())
+
+
+def _business_ordinals(days: np.ndarray) -> np.ndarray:
+    # Business days since 1970-01-01 (a Thursday); consecutive across weekends
+    return np.busday_count(np.datetime64("1970-01-01"), days.astype("datetime64[D]"))
+
+
+def _business_days(ordinals: np.ndarray) -> np.ndarray:
+    return np.busday_offset(np.datetime64("1970-01-01"), ordinals).astype("int64")
+
+
+def _aggregate_levels(hours: np.ndarray, counts: np.ndarray) -> Dict[str, Dict]:
+    """
+    Roll per-hour counts up to every frequency. Coarser levels work on
+    the distinct hours only, not on the rows.
+
+    A daily level with no Saturday / Sunday observations is measured in
+    business days, so weekends count neither against its fill ratio nor
+    as missing periods.
+    """
+    levels = {}
+    for frequency in FREQUENCIES:
+        codes, totals = _count_sorted(_level_codes(hours, frequency), counts)
+        business_days = frequency == "daily" and _weekdays_only(codes)
+        positions = _business_ordinals(codes) if business_days else codes
+        span = int(positions[-1] - positions[0]) + 1
+        levels[frequency] = {
+            "codes": codes,
+            "counts": totals,
+            "fill_ratio": len(codes) / span,
+            "business_days": business_days,
+        }
+    return levels
+
+
+def _choose_frequency(levels: Dict[str, Dict]) -> Optional[str]:
+    """
+    Finest level that is well filled and still readable; otherwise the
+    best-filled level with enough periods for a trend.
+    """
+    eligible = [f for f in FREQUENCIES if len(levels[f]["codes"]) >= MIN_PERIODS]
+    for frequency in eligible:
+        level = levels[frequency]
+        if level["fill_ratio"] >= FILL_RATIO_TARGET and len(level["codes"]) <= MAX_PRIMARY_PERIODS:
+            return frequency
+    if not eligible:
+        return None
+    return max(eligible, key=lambda f: levels[f]["fill_ratio"])   # ties keep the finer level
+
+
+def _metric_columns(column_profiles: List[Dict], date_col: str) -> List[str]:
+    """
+    Numeric columns worth aggregating, capped at MAX_METRICS.
+    """
+    return [
+        col["name"] for col in column_profiles
+        if col["metrics"]["inferred_type"] == "number"
+        and col["metrics"]["null_percentage"] <= METRIC_MAX_NULL_PERCENTAGE
+        and col["name"] != date_col
+    ][:MAX_METRICS]
+
+
+def _aggregate_metrics(
+    df: pd.DataFrame,
+    metric_cols: List[str],
+    mask: np.ndarray,
+    codes: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-period sum and non-null count of every metric column in one
+    grouped reduction over a 2-D block: (period codes, sums, counts,
+    rows per period).
+    """
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    block = df[metric_cols].to_numpy(dtype="float64", na_value=np.nan)[mask][order]
+
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    present = ~np.isnan(block)
+    sums = np.add.reduceat(np.where(present, block, 0.0), starts, axis=0)
+    counts = np.add.reduceat(present.astype("int64"), starts, axis=0)
+    rows = np.diff(np.r_[starts, len(sorted_codes)])
+    return sorted_codes[starts], sums, counts, rows
+
+
+def _period_scale(periods: np.ndarray, rows: np.ndarray, level: Dict) -> np.ndarray:
+    """
+    Exact full-file rows over sample rows for each sampled period (a
+    ratio estimator), so sample sums line up with exact row counts.
+    Periods the exact counts lack use the overall ratio.
+    """
+    codes, counts = level["codes"], level["counts"]
+    index = np.minimum(np.searchsorted(codes, periods), len(codes) - 1)
+    found = codes[index] == periods
+    overall = counts.sum() / rows.sum()
+    return np.where(found, counts[index] / rows, overall)
+
+
+def _metric_series(labels: List[str], sums: np.ndarray, counts: np.ndarray) -> List[Dict]:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+    return [
+        {
+            "period": period,
+            "sum": float(total),
+            "mean": float(mean) if count else None,
+            "count": int(round(count)),
+        }
+        for period, total, mean, count in zip(labels, sums, means, counts)
+    ]
+
+
+def _change_signals(
+    values: np.ndarray,
+    labels: List[str],
+    codes: np.ndarray,
+    frequency: str,
+    metric: Optional[str] = None,
+) -> List[Dict]:
+    """
+    Spikes, drops and sustained shifts from the anomaly engine as
+    signals; `metric` names the aggregated column (None for row counts).
+    """
+    signals = []
+    subject = f" in {metric}" if metric else ""
+    metric_evidence = [f"metric = sum({metric})"] if metric else []
+
+    for anomaly in detect_anomalies(values, codes, frequency):
+        period = labels[anomaly["index"]]
+        baseline = anomaly["baseline"]
+        change = anomaly["value"] / baseline - 1 if baseline else float("nan")
+        change_evidence = [f"change = {change:+.0%}"] if np.isfinite(change) else []
+        z_evidence = [f"robust_z = {anomaly['z']:.1f}"] if "z" in anomaly else []
+        common = {
+            "period": period,
+            "metric": metric,
+            "score": round(anomaly["score"], 3),
+        }
+
+        if anomaly["kind"] == "drop":
+            signals.append({
+                "type": "RISK",
+                "code": "SUDDEN_DROP",
+                "severity": "high",
+                "message": f"Sudden drop{subject} detected in period {period}.",
+                "evidence": change_evidence + z_evidence + metric_evidence,
+                "impact": "Business activity may have declined sharply.",
+                **common,
+            })
+        elif anomaly["kind"] == "spike":
+            signals.append({
+                "type": "SIGNAL",
+                "code": "SUDDEN_SPIKE",
+                "severity": "medium",
+                "message": f"Sudden spike{subject} detected in period {period}.",
+                "evidence": change_evidence + z_evidence + metric_evidence,
+                "impact": "Business activity may have spiked unusually.",
+                **common,
+            })
+        else:
+            declining = anomaly["kind"] == "shift_down"
+            signals.append({
+                "type": "RISK" if declining else "SIGNAL",
+                "code": "TREND_SHIFT",
+                "severity": "high" if declining else "medium",
+                "message": (
+                    f"Sustained {'decline' if declining else 'increase'}{subject} "
+                    f"starting in period {period}."
+                ),
+                "evidence": change_evidence + [f"cusum = {anomaly['statistic']:.1f}"] + metric_evidence,
+                "impact": (
+                    "Activity has settled at a lower level."
+                    if declining else "Activity has settled at a higher level."
+                ),
+                **common,
+            })
+
+    return signals
+
+
+def _gap_ranges(codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Missing stretches between sorted unique period codes as inclusive
+    (starts, ends); cost is linear in observed periods, not in the span.
+    """
+    after = np.flatnonzero(np.diff(codes) > 1)
+    return codes[after] + 1, codes[after + 1] - 1
+
+
+def _gap_list(starts: np.ndarray, ends: np.ndarray, label: Callable[[np.ndarray], List[str]]) -> List[Dict]:
+    # The MAX_GAPS longest gaps, reported in time order
+    order = np.argsort(-(ends - starts), kind="stable")[:MAX_GAPS]
+    order.sort()
+    start_labels = label(starts[order])
+    end_labels = label(ends[order])
+    return [
+        {"start": start, "end": end, "length": int(length)}
+        for start, end, length in zip(start_labels, end_labels, ends[order] - starts[order] + 1)
+    ]
+
+
+def _first_missing(starts: np.ndarray, ends: np.ndarray, n: int = 10) -> np.ndarray:
+    # The first `n` missing period codes, expanded from the leading gaps only
+    lengths = ends - starts + 1
+    leading = int(np.searchsorted(np.cumsum(lengths), n)) + 1
+    expanded = [
+        np.arange(start, min(end, start + n - 1) + 1)
+        for start, end in zip(starts[:leading], ends[:leading])
+    ]
+    return np.concatenate(expanded)[:n]
+
+
+def _series(level: Dict, frequency: str) -> List[Dict]:
+    return [
+        {"period": period, "count": int(count)}
+        for period, count in zip(_level_labels(level["codes"], frequency), level["counts"])
+    ]
 
 
 def detect_time_series(
     df: pd.DataFrame,
     column_profiles: List[Dict],
+    date_counts: Optional[Dict[str, pd.Series]] = None,
 ) -> Dict:
     """
     Detect time-series structure, aggregate activity,
     and surface temporal risks with numeric evidence.
 
+    `date_counts` holds exact per-hour row counts over the full file
+    (from FullDataStats); when present for the detected date column,
+    period counts and missing periods use them instead of the sample.
+
+    Counts are built at hourly, daily, weekly, monthly and quarterly
+    resolution; `frequency` is the finest well-filled level (signals
+    run there) and `levels` carries every level for zooming. Weekday-only
+    daily data is judged on business days (`business_days`).
+    `metrics` holds per-period sum/mean/count of up to MAX_METRICS
+    numeric columns. They come from the sample; next to exact counts
+    their sums and counts are scaled up per period and
+    `metrics_estimated` is set. Row counts and every metric go through
+    the anomaly engine (spikes, drops and sustained level shifts).
+
     BACKWARD COMPATIBLE:
     - Existing keys preserved
     - Adds `series` for chart-ready data
@@ -48,7 +454,11 @@ def detect_time_series(
     # --------------------------------------------------
     # Step 1: Identify candidate date columns
     # --------------------------------------------------
-    date_candidates = []
+    # Native datetime columns (e.g. Arrow-parsed dates) are tried first
+    date_candidates = [
+        col["name"] for col in column_profiles
+        if col["metrics"]["inferred_type"] == "datetime"
+    ]
     for col in column_profiles:
         if col["metrics"]["inferred_type"] in {"categorical", "string"}:
             date_candidates.append(col["name"])
@@ -66,102 +476,116 @@ def detect_time_series(
     if parsed_dates is None:
         return result  # No safe datetime column found
 
-    df_ts = df.copy()
-    df_ts["_parsed_date"] = parsed_dates
-    df_ts = df_ts.dropna(subset=["_parsed_date"])
+    # Only the parsed date array is kept; the frame itself is never copied
+    mask, row_hours = _row_hours(parsed_dates)
 
-    if df_ts.empty:
+    if row_hours.size == 0:
         return result
 
     result["date_column"] = date_col
 
     # --------------------------------------------------
-    # Step 2: Determine frequency (daily vs monthly)
+    # Step 2: Aggregate every resolution in one pass (CORE DATA)
     # --------------------------------------------------
-    df_ts = df_ts.sort_values("_parsed_date")
-    date_diffs = df_ts["_parsed_date"].diff().dropna()
+    exact_hours = (date_counts or {}).get(date_col)
+    exact = exact_hours is not None and len(exact_hours) > 0
 
-    median_diff_days = date_diffs.dt.days.median()
-
-    if median_diff_days is not None and median_diff_days >= 25:
-        frequency = "monthly"
-        df_ts["period"] = df_ts["_parsed_date"].dt.to_period("M").astype(str)
+    if exact:
+        hours, hour_counts = _exact_hour_counts(exact_hours)
     else:
-        frequency = "daily"
-        df_ts["period"] = df_ts["_parsed_date"].dt.date.astype(str)
+        hours, hour_counts = _hour_counts(row_hours)
 
-    result["frequency"] = frequency
+    levels = _aggregate_levels(hours, hour_counts)
 
     # --------------------------------------------------
-    # Step 3: Aggregate counts per period (CORE DATA)
+    # Step 3: Choose the primary frequency by fill ratio
     # --------------------------------------------------
-    counts = (
-        df_ts
-        .groupby("period")
-        .size()
-        .sort_index()
-    )
-
-    if len(counts) < 3:
+    frequency = _choose_frequency(levels)
+    if frequency is None:
         return result  # Not enough data for trend analysis
 
+    result["frequency"] = frequency
+    level = levels[frequency]
+    codes = level["codes"]
+    labels = _level_labels(codes, frequency)
+
     # 🔥 Persist numeric series for charts
-    result["series"] = [
-        {"period": period, "count": int(count)}
-        for period, count in counts.items()
-    ]
+    result["series"] = _series(level, frequency)
+
+    # Every resolution, so the frontend can zoom without another request
+    result["levels"] = {
+        f: {
+            "fill_ratio": round(levels[f]["fill_ratio"], 4),
+            "periods": len(levels[f]["codes"]),
+            "series": result["series"] if f == frequency else _series(levels[f], f),
+        }
+        for f in FREQUENCIES
+        if len(levels[f]["codes"]) <= MAX_LEVEL_PERIODS
+    }
 
     # --------------------------------------------------
-    # Step 4: Detect sudden drops / spikes
+    # Step 4: Aggregate numeric metrics per period (sample rows)
     # --------------------------------------------------
-    pct_change = counts.pct_change()
+    metric_cols = _metric_columns(column_profiles, date_col)
+    metric_values = {}
+    metric_labels: List[str] = []
+    result["metrics"] = {}
 
-    for period, change in pct_change.items():
-        if pd.isna(change):
-            continue
+    if metric_cols:
+        periods, sums, metric_counts, rows = _aggregate_metrics(
+            df, metric_cols, mask, _level_codes(row_hours, frequency)
+        )
+        if exact:
+            scale = _period_scale(periods, rows, level)
+            if not np.allclose(scale, 1.0):
+                sums = sums * scale[:, None]
+                metric_counts = metric_counts * scale[:, None]
+                result["metrics_estimated"] = True
+        metric_labels = _level_labels(periods, frequency)
+        for j, metric in enumerate(metric_cols):
+            result["metrics"][metric] = _metric_series(metric_labels, sums[:, j], metric_counts[:, j])
+            metric_values[metric] = (periods, sums[:, j])
 
-        if change <= -DROP_SPIKE_THRESHOLD:
-            result["signals"].append({
-                "type": "RISK",
-                "code": "SUDDEN_DROP",
-                "severity": "high",
-                "message": f"Sudden drop detected in period {period}.",
-                "evidence": [f"change = {change:.0%}"],
-                "impact": "Business activity may have declined sharply.",
-                "period": period,
-            })
-
-        elif change >= DROP_SPIKE_THRESHOLD:
-            result["signals"].append({
-                "type": "SIGNAL",
-                "code": "SUDDEN_SPIKE",
-                "severity": "medium",
-                "message": f"Sudden spike detected in period {period}.",
-                "evidence": [f"change = +{change:.0%}"],
-                "impact": "Business activity may have spiked unusually.",
-                "period": period,
-            })
+    # --------------------------------------------------
+    # Step 5: Detect anomalies (rows, then each metric)
+    # --------------------------------------------------
+    result["signals"].extend(_change_signals(level["counts"], labels, codes, frequency))
+    for metric, (metric_periods, values) in metric_values.items():
+        result["signals"].extend(
+            _change_signals(values, metric_labels, metric_periods, frequency, metric)
+        )
 
     # --------------------------------------------------
-    # Step 5: Detect missing periods
+    # Step 6: Detect missing periods
     # --------------------------------------------------
-    expected_periods = pd.period_range(
-        start=pd.to_datetime(df_ts["_parsed_date"].min()),
-        end=pd.to_datetime(df_ts["_parsed_date"].max()),
-        freq="M" if frequency == "monthly" else "D",
-    ).astype(str)
+    if level["business_days"]:
+        result["business_days"] = True
+        gap_starts, gap_ends = _gap_ranges(_business_ordinals(codes))
+
+        def label(ordinals: np.ndarray) -> List[str]:
+            return _level_labels(_business_days(ordinals), frequency)
+    else:
+        gap_starts, gap_ends = _gap_ranges(codes)
 
-    missing_periods = set(expected_periods) - set(counts.index)
+        def label(period_codes: np.ndarray) -> List[str]:
+            return _level_labels(period_codes, frequency)
 
-    if missing_periods:
+    if gap_starts.size:
+        lengths = gap_ends - gap_starts + 1
+        longest = int(np.argmax(lengths))
         result["signals"].append({
             "type": "WARNING",
             "code": "MISSING_PERIODS",
             "severity": "medium",
             "message": "Missing time periods detected in the data.",
-            "evidence": [f"missing_count = {len(missing_periods)}"],
+            "evidence": [
+                f"missing_count = {int(lengths.sum())}",
+                f"gap_count = {gap_starts.size}",
+                f"longest_gap = {int(lengths[longest])} periods",
+            ],
             "impact": "Trends may be misleading due to data gaps.",
-            "missing_periods": sorted(list(missing_periods))[:10],
+            "gaps": _gap_list(gap_starts, gap_ends, label),
+            "missing_periods": label(_first_missing(gap_starts, gap_ends)),
         })
 
     return result
@@ -1,12 +1,18 @@
 # app/engine/type_inference.py
+from typing import Dict, Optional
+
 import pandas as pd
 
+from app.engine.column_summary import summarize_columns
+
 
-def infer_types(df: pd.DataFrame) -> dict:
+def infer_types(df: pd.DataFrame, summaries: Optional[Dict[str, Dict]] = None) -> dict:
+    summaries = summaries or summarize_columns(df)
     inferred = {}
 
     for col in df.columns:
         series = df[col]
+        summary = summaries[col]
 
         if pd.api.types.is_numeric_dtype(series):
             inferred[col] = "number"
@@ -14,7 +20,7 @@ def infer_types(df: pd.DataFrame) -> dict:
             inferred[col] = "boolean"
         elif pd.api.types.is_datetime64_any_dtype(series):
             inferred[col] = "datetime"
-        elif series.nunique() / max(len(series), 1) < 0.2:
+        elif summary["unique_count"] / max(summary["rows"], 1) < 0.2:
             inferred[col] = "categorical"
         else:
             inferred[col] = "string"
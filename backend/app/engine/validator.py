@@ -1,15 +1,20 @@
 # app/engine/validator.py
+from typing import Dict, Optional
+
 import pandas as pd
 
+from app.engine.column_summary import summarize_columns
+
 
-def validate_dataset(df: pd.DataFrame):
+def validate_dataset(df: pd.DataFrame, summaries: Optional[Dict[str, Dict]] = None):
+    summaries = summaries or summarize_columns(df)
     issues = []
 
     for col in df.columns:
-        series = df[col]
+        summary = summaries[col]
 
         # High null ratio
-        null_ratio = series.isna().mean()
+        null_ratio = summary["null_ratio"]
         if null_ratio > 0.5:
             issues.append({
                 "severity": "warning",
@@ -19,7 +24,7 @@ def validate_dataset(df: pd.DataFrame):
             })
 
         # Constant or near-constant column
-        if series.nunique(dropna=True) <= 1:
+        if summary["unique_count"] <= 1:
             issues.append({
                 "severity": "warning",
                 "code": "CONSTANT_COLUMN",
@@ -27,32 +32,25 @@ def validate_dataset(df: pd.DataFrame):
                 "column": col,
             })
 
-        # Numeric outliers (IQR)
-        if pd.api.types.is_numeric_dtype(series):
-            clean = series.dropna()
-            if not clean.empty:
-                q1 = clean.quantile(0.25)
-                q3 = clean.quantile(0.75)
-                iqr = q3 - q1
-
-                lower = q1 - 1.5 * iqr
-                upper = q3 + 1.5 * iqr
-
-                outlier_ratio = ((clean < lower) | (clean > upper)).mean()
+        # Numeric outliers (IQR bounds shared with the profiler)
+        numeric = summary["numeric"]
+        if numeric is not None:
+            outlier_ratio = numeric["outlier_count"] / (summary["rows"] - summary["null_count"])
 
-                if outlier_ratio > 0.05:
-                    issues.append({
-                        "severity": "warning",
-                        "code": "EXTREME_OUTLIERS",
-                        "message": f"Column '{col}' has {outlier_ratio:.0%} values outside IQR bounds",
-                        "column": col,
-                    })
+            if outlier_ratio > 0.05:
+                issues.append({
+                    "severity": "warning",
+                    "code": "EXTREME_OUTLIERS",
+                    "message": f"Column '{col}' has {outlier_ratio:.0%} values outside IQR bounds",
+                    "column": col,
+                })
 
         # Categorical dominance risk
-        if series.dtype == "object":
-            value_counts = series.value_counts(dropna=True)
+        if summary["is_text"]:
+            value_counts = summary["value_counts"]
             if not value_counts.empty:
-                dominant_ratio = value_counts.iloc[0] / value_counts.sum()
+                # Non-null rows, not value_counts.sum(): sketches keep only the top values
+                dominant_ratio = value_counts.iloc[0] / (summary["rows"] - summary["null_count"])
 
                 if dominant_ratio > 0.8:
                     issues.append({
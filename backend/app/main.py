@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.ingest import router as ingest_router
+from app.api.metrics import router as metrics_router
 import os
 
 app = FastAPI(title="BYOD AI Platform – Data Engine")
@@ -27,6 +28,7 @@ app.add_middleware(
 )
 
 app.include_router(ingest_router)
+app.include_router(metrics_router)
 
 @app.get("/")
 def root():
@@ -1,8 +1,75 @@
 # app/models/schemas.py
-from typing import List, Optional, Any
+"""
+Response models for the ingestion payload.
+
+The pipeline builds plain dicts and they are serialized directly (see
+app/utils/serialization.py); these models document the contract in
+the OpenAPI schema and can check a payload against it
+(INGEST_VALIDATE_RESPONSE=1).
+"""
+from typing import Any, Dict, List, Optional
+
 from pydantic import BaseModel
 
 
+# --------------------------------------------------
+# Ingestion metadata
+# --------------------------------------------------
+class MemoryFootprint(BaseModel):
+    bytes_before: int
+    bytes_after: int
+
+
+class CacheInfo(BaseModel):
+    hit: bool
+    tier: Optional[str] = None      # "memory" | "disk"
+    key: Optional[str] = None
+
+
+class IngestionMeta(BaseModel):
+    total_rows: int
+    sampled: bool
+    sample_size: int
+    sampling_ratio: float
+    streamed: bool
+    encoding: str
+    engine: str                     # "pandas" | "pyarrow"
+    exact_stats: bool
+    total_columns: int              # header width, before column selection
+    sections: List[str]             # response sections included
+    memory: Optional[MemoryFootprint] = None
+    cache: Optional[CacheInfo] = None
+
+
+# --------------------------------------------------
+# Dataset & columns
+# --------------------------------------------------
+class DuplicateCluster(BaseModel):
+    count: int
+    example_row: Optional[int] = None
+    values: Optional[Dict[str, Any]] = None     # None when the row is not in the sample
+
+
+class DuplicateSummary(BaseModel):
+    duplicate_rows: int
+    clusters: List[DuplicateCluster]
+    verified: bool
+    hash_collisions: Optional[int] = None
+    key_columns: List[str]
+    near_duplicate_rows: Optional[int] = None
+    approximate: Optional[bool] = None          # full-file count from a Bloom filter
+    false_positive_rate: Optional[float] = None
+
+
+class DatasetProfile(BaseModel):
+    rows_analyzed: int
+    columns: int
+    duplicate_rows: int
+    duplicates: Optional[DuplicateSummary] = None
+    missing_cells_percentage: float
+    exact_counts: Optional[bool] = None
+
+
 class DataIssue(BaseModel):
     severity: str  # "warning" | "critical"
     code: str
@@ -10,12 +77,41 @@ class DataIssue(BaseModel):
     column: Optional[str] = None
 
 
+class TopValue(BaseModel):
+    value: Any
+    count: int
+
+
+class ApproximationErrors(BaseModel):
+    unique_count_rse: Optional[float] = None
+    top_count_max_error: Optional[int] = None
+    quantile_rank_error: Optional[float] = None
+
+
+class ColumnStats(BaseModel):
+    # number
+    min: Optional[float] = None
+    max: Optional[float] = None
+    mean: Optional[float] = None
+    std: Optional[float] = None
+    median: Optional[float] = None
+    outlier_count: Optional[int] = None
+    iqr_lower_bound: Optional[float] = None
+    iqr_upper_bound: Optional[float] = None
+    # categorical
+    top_values: Optional[List[TopValue]] = None
+    entropy: Optional[float] = None
+    dominant_ratio: Optional[float] = None
+    # sketch-based values
+    approximate: Optional[ApproximationErrors] = None
+
+
 class ColumnMetrics(BaseModel):
     inferred_type: str
     null_count: int
     null_percentage: float
     unique_count: int
-    stats: Optional[dict] = None
+    stats: Optional[ColumnStats] = None
 
 
 class ColumnProfile(BaseModel):
@@ -24,14 +120,136 @@ class ColumnProfile(BaseModel):
     issues: List[DataIssue]
 
 
-class DatasetProfile(BaseModel):
-    rows: int
-    columns: int
-    duplicate_rows: int
-    missing_cells_percentage: float
+class QualitySummary(BaseModel):
+    critical_issues: int
+    warnings: int
+
+
+# --------------------------------------------------
+# Time series
+# --------------------------------------------------
+class SeriesPoint(BaseModel):
+    period: str
+    count: int
+
+
+class MetricPoint(BaseModel):
+    period: str
+    sum: float
+    mean: Optional[float] = None
+    count: int
+
+
+class TimeSeriesLevel(BaseModel):
+    fill_ratio: float
+    periods: int
+    series: List[SeriesPoint]
+
+
+class GapRange(BaseModel):
+    start: str
+    end: str
+    length: int
+
+
+class TimeSeriesSignal(BaseModel):
+    type: str
+    code: str
+    severity: str
+    message: str
+    evidence: List[str] = []
+    impact: Optional[str] = None
+    period: Optional[str] = None
+    metric: Optional[str] = None
+    score: Optional[float] = None
+    gaps: Optional[List[GapRange]] = None
+    missing_periods: Optional[List[str]] = None
+
+
+class TimeSeriesResult(BaseModel):
+    date_column: Optional[str] = None
+    frequency: Optional[str] = None
+    business_days: Optional[bool] = None        # weekday-only daily data; weekends are not gaps
+    series: List[SeriesPoint] = []
+    signals: List[TimeSeriesSignal] = []
+    levels: Optional[Dict[str, TimeSeriesLevel]] = None
+    metrics: Optional[Dict[str, List[MetricPoint]]] = None
+    metrics_estimated: Optional[bool] = None    # sample sums scaled to the exact row counts
+
+
+# --------------------------------------------------
+# Insights, charts, decisions
+# --------------------------------------------------
+class Confidence(BaseModel):
+    score: float
+    label: str
+    factors: List[str]
+
+
+class Insight(BaseModel):
+    type: str
+    code: str
+    severity: str
+    message: str
+    evidence: List[str] = []
+    impact: Optional[str] = None
+    recommendation: Optional[str] = None
+    anomaly_score: Optional[float] = None
+    confidence: Confidence
+
+
+class ChartAnnotation(BaseModel):
+    x: str
+    label: str
+
+
+class Chart(BaseModel):
+    insight_code: str
+    title: str
+    type: str                       # "bar" | "line"
+    data: List[Dict[str, Any]]
+    xKey: str
+    yKey: str
+    annotations: Optional[List[ChartAnnotation]] = None
+    caption: Optional[str] = None
+
+
+class NextStep(BaseModel):
+    title: str
+    description: str
+    priority: int
+    derived_from: str
+    category: Optional[str] = None
+
+
+class ScopedChatHook(BaseModel):
+    insight_id: int
+    insight_code: str
+    allowed_questions: List[str]
+
+
+class StageTiming(BaseModel):
+    wall_seconds: float
+    cpu_seconds: float
+    peak_rss_growth_bytes: int
+    tracemalloc_peak_bytes: Optional[int] = None
+
+
+class Timings(BaseModel):
+    total_seconds: float
+    stages: Dict[str, StageTiming]
+    input: Dict[str, int]
 
 
 class IngestionResponse(BaseModel):
-    dataset: DatasetProfile
-    columns: List[ColumnProfile]
-    quality_summary: dict
+    # Every section is present unless ?sections= narrows the response
+    ingestion: IngestionMeta
+    dataset: Optional[DatasetProfile] = None
+    time_series: Optional[TimeSeriesResult] = None
+    columns: Optional[List[ColumnProfile]] = None
+    quality_summary: Optional[QualitySummary] = None
+    insights: Optional[List[Insight]] = None
+    charts: Optional[List[Chart]] = None
+    next_steps: Optional[List[NextStep]] = None
+    scoped_chat: Optional[List[ScopedChatHook]] = None
+    timings: Optional[Timings] = None     # ?timings=true
@@ -1,6 +1,15 @@
+import os
+from typing import Callable, Iterable, List, Optional
+
 from fastapi import UploadFile, HTTPException
 
 from app.engine.csv_parser import parse_csv
+from app.engine.column_summary import summarize_columns
+from app.engine.parallel_summary import PROFILE_WORKERS
+from app.engine.sketches import PROFILE_SKETCHES
+from app.engine.full_stats import FullDataStats, apply_exact_stats, apply_exact_summaries
+from app.engine.duplicate_engine import DUPLICATE_KEY_COLUMNS, apply_exact_duplicates, find_duplicates
+from app.engine.memory_optimizer import optimize_frame
 from app.engine.type_inference import infer_types
 from app.engine.profiler import profile_columns
 from app.engine.validator import validate_dataset
@@ -8,11 +17,104 @@ from app.engine.insight_engine import generate_insights
 from app.engine.chart_mapper import map_insights_to_charts
 from app.engine.time_series_engine import detect_time_series
 from app.engine.decision_engine import generate_next_steps
+from app.services.metrics import StageTimer, instrumented
+from app.services.result_cache import cache_key, result_cache
+from app.services.worker_pool import PoolSaturated, ingest_pool
+from app.utils.limits import INGEST_RETRY_AFTER_SECONDS
+
+
+PIPELINE_STAGES = (
+    "parse", "profile", "time_series", "insights", "charts", "decisions", "scoped_chat",
+)
+
+# Response sections a caller can select ("ingestion" is always returned)
+RESPONSE_SECTIONS = (
+    "dataset", "time_series", "columns", "quality_summary",
+    "insights", "charts", "next_steps", "scoped_chat",
+)
+
+# Steps each section needs, including those feeding the steps it uses
+_INSIGHT_STEPS = {"profile", "validate", "duplicates", "time_series", "insights"}
+SECTION_STEPS = {
+    "dataset": {"duplicates"},
+    "time_series": {"profile", "time_series"},
+    "columns": {"profile"},
+    "quality_summary": {"validate"},
+    "insights": _INSIGHT_STEPS,
+    "charts": _INSIGHT_STEPS | {"charts"},
+    "next_steps": _INSIGHT_STEPS | {"decisions"},
+    "scoped_chat": _INSIGHT_STEPS | {"scoped_chat"},
+}
 
 
-async def ingest_csv(file: UploadFile):
+def resolve_sections(sections: Optional[Iterable[str]] = None) -> List[str]:
     """
-    Main ingestion orchestration pipeline.
+    Requested sections in response order (all when none are given).
+    """
+    if not sections:
+        return list(RESPONSE_SECTIONS)
+    unknown = sorted(set(sections) - set(RESPONSE_SECTIONS))
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown sections: {', '.join(unknown)} (expected {', '.join(RESPONSE_SECTIONS)})",
+        )
+    return [section for section in RESPONSE_SECTIONS if section in sections]
+
+
+async def ingest_csv(
+    file: UploadFile,
+    timings: bool = False,
+    columns: Optional[List[str]] = None,
+    exclude_columns: Optional[List[str]] = None,
+    sections: Optional[List[str]] = None,
+):
+    """
+    Run the ingestion pipeline on the bounded worker pool so CPU-bound
+    parsing and profiling never block the event loop. Saturation is
+    reported as 503 with Retry-After instead of an unbounded wait.
+    """
+    sections = resolve_sections(sections)
+    try:
+        return await ingest_pool.run(
+            run_ingestion_pipeline, file,
+            timings=timings, columns=columns, exclude_columns=exclude_columns, sections=sections,
+        )
+    except PoolSaturated:
+        raise HTTPException(
+            status_code=503,
+            detail="Ingestion capacity reached, please retry shortly",
+            headers={"Retry-After": str(INGEST_RETRY_AFTER_SECONDS)},
+        )
+
+
+def _upload_bytes(file: UploadFile) -> int:
+    fileobj = file.file
+    fileobj.seek(0, os.SEEK_END)
+    size = fileobj.tell()
+    fileobj.seek(0)
+    return size
+
+
+def run_ingestion_pipeline(
+    file: UploadFile,
+    progress: Optional[Callable[[str, StageTimer], None]] = None,
+    timings: bool = False,
+    columns: Optional[List[str]] = None,
+    exclude_columns: Optional[List[str]] = None,
+    sections: Optional[List[str]] = None,
+):
+    """
+    Main ingestion orchestration pipeline (synchronous, CPU-bound).
+
+    `progress(stage, timer)` is called as each of PIPELINE_STAGES
+    starts, with the run's StageTimer (finished stages in timer.stages).
+    Every stage is timed into the /metrics histograms; `timings=True`
+    also returns the per-stage numbers in the response.
+
+    `columns` / `exclude_columns` restrict parsing to those headers.
+    `sections` limits the response to those RESPONSE_SECTIONS; steps
+    none of them needs (SECTION_STEPS) are skipped.
 
     Responsibilities:
     - Parse & sample CSV safely
@@ -22,92 +124,176 @@ async def ingest_csv(file: UploadFile):
     - Derive prioritized decision actions (Phase 2)
     - Prepare LLM-ready scoped hooks (NO LLM calls)
     """
+    options = {
+        "columns": sorted(columns or ()),
+        "exclude_columns": sorted(exclude_columns or ()),
+        "sections": resolve_sections(sections),
+    }
+    with instrumented() as timer:
+        return _run_pipeline(file, progress or (lambda stage, timer: None), timer, timings, options)
+
+
+def _run_pipeline(
+    file: UploadFile,
+    progress: Callable[[str, StageTimer], None],
+    timer: StageTimer,
+    timings: bool,
+    options: dict,
+):
+    def start(stage: str) -> None:
+        timer.start(stage)
+        progress(stage, timer)
+
+    timer.input["bytes"] = _upload_bytes(file)
+
+    sections = options["sections"]
+    steps = set().union(*(SECTION_STEPS[section] for section in sections))
+
+    # --------------------------------------------------
+    # Step 0: Result cache (same bytes + same engine config + same options)
+    # --------------------------------------------------
+    key = None
+    if result_cache.enabled:
+        key = cache_key(file.file, options)
+        cached, tier = result_cache.get(key)
+        if cached is not None:
+            timer.outcome = "cache_hit"
+            cached["ingestion"]["cache"] = {"hit": True, "tier": tier, "key": key}
+            if timings:
+                cached["timings"] = timer.timings()
+            return cached
 
     # --------------------------------------------------
     # Step 1: Parse CSV (sampling + encoding safety)
     # --------------------------------------------------
+    start("parse")
+    full_stats = FullDataStats()
     try:
-        df, ingestion_meta = parse_csv(file)
+        df, ingestion_meta = parse_csv(
+            file,
+            accumulator=full_stats,
+            columns=options["columns"],
+            exclude_columns=options["exclude_columns"],
+        )
     except Exception as e:
         raise HTTPException(status_code=422, detail=str(e))
 
+    exact_stats = full_stats.result() if ingestion_meta["exact_stats"] else None
+    timer.input.update(rows=ingestion_meta["total_rows"], columns=len(df.columns))
+
+    # Compact dtypes so every later stage works on narrow numerics / codes
+    df, ingestion_meta["memory"] = optimize_frame(df)
+    ingestion_meta["sections"] = sections
+
+    # Outputs of skipped steps stay empty; nothing requested reads them
+    column_profiles, dataset_issues, dataset_profile = [], [], {}
+    time_series_result, insights, charts, next_steps, scoped_chat = {}, [], [], [], []
+
     # --------------------------------------------------
     # Step 2: Dataset validation & profiling
     # --------------------------------------------------
-    dataset_issues = validate_dataset(df)
-    column_types = infer_types(df)
-    column_profiles = profile_columns(df, column_types)
+    # Duplicate detection is timed as part of this stage
+    if steps & {"profile", "validate", "duplicates"}:
+        start("profile")
+    if steps & {"profile", "validate"}:
+        summaries = summarize_columns(df, workers=PROFILE_WORKERS, sketch=PROFILE_SKETCHES)
+        if exact_stats:
+            apply_exact_summaries(summaries, exact_stats)   # full-file IQR and outlier counts
+        if "validate" in steps:
+            dataset_issues = validate_dataset(df, summaries)
+        if "profile" in steps:
+            column_types = infer_types(df, summaries)
+            column_profiles = profile_columns(df, column_types, summaries)
 
-    dataset_profile = {
-        "rows_analyzed": len(df),
-        "columns": len(df.columns),
-        "duplicate_rows": int(df.duplicated().sum()),
-        "missing_cells_percentage": float(df.isna().mean().mean() * 100),
-    }
+    if "duplicates" in steps:
+        duplicates = find_duplicates(df, key_columns=DUPLICATE_KEY_COLUMNS)
+
+        dataset_profile = {
+            "rows_analyzed": len(df),
+            "columns": len(df.columns),
+            "duplicate_rows": duplicates["duplicate_rows"],
+            "duplicates": duplicates,
+            "missing_cells_percentage": float(df.isna().mean().mean() * 100),
+        }
+
+    # Exact full-file counts replace sample estimates where available
+    if exact_stats:
+        if "duplicates" in steps:
+            apply_exact_duplicates(duplicates, exact_stats["duplicates"], df)
+        apply_exact_stats(column_profiles, dataset_profile, exact_stats)
 
     # --------------------------------------------------
     # Step 3: Time-series intelligence (deterministic)
     # --------------------------------------------------
-    time_series_result = detect_time_series(
-        df=df,
-        column_profiles=column_profiles,
-    )
-
-    # Defensive normalization
-    if not time_series_result:
-        time_series_result = {
-            "date_column": None,
-            "frequency": None,
-            "series": [],
-            "signals": [],
-        }
+    if "time_series" in steps:
+        start("time_series")
+        time_series_result = detect_time_series(
+            df=df,
+            column_profiles=column_profiles,
+            date_counts=exact_stats["date_counts"] if exact_stats else None,
+        )
+
+        # Defensive normalization
+        if not time_series_result:
+            time_series_result = {
+                "date_column": None,
+                "frequency": None,
+                "series": [],
+                "signals": [],
+            }
 
     # --------------------------------------------------
     # Step 4: Insight generation (semantic layer)
     # --------------------------------------------------
-    insights = generate_insights(
-        dataset_profile=dataset_profile,
-        column_profiles=column_profiles,
-        dataset_issues=dataset_issues,
-        time_series_result=time_series_result,
-        ingestion_meta=ingestion_meta,
-    )
+    if "insights" in steps:
+        start("insights")
+        insights = generate_insights(
+            dataset_profile=dataset_profile,
+            column_profiles=column_profiles,
+            dataset_issues=dataset_issues,
+            time_series_result=time_series_result,
+            ingestion_meta=ingestion_meta,
+        )
 
     # --------------------------------------------------
     # Step 5: Chart generation (evidence → visuals)
     # --------------------------------------------------
-    charts = map_insights_to_charts(
-        insights=insights,
-        column_profiles=column_profiles,
-        time_series=time_series_result,
-    )
+    if "charts" in steps:
+        start("charts")
+        charts = map_insights_to_charts(
+            insights=insights,
+            column_profiles=column_profiles,
+            time_series=time_series_result,
+        )
 
     # --------------------------------------------------
     # 🚀 Step 6: Decision Intelligence (Phase 2)
     # --------------------------------------------------
-    next_steps = generate_next_steps(insights)
+    if "decisions" in steps:
+        start("decisions")
+        next_steps = generate_next_steps(insights)
 
     # --------------------------------------------------
     # Step 7: Scoped AI hooks (LLM-READY, NOT USED)
     # --------------------------------------------------
-    scoped_chat = []
-    for idx, insight in enumerate(insights):
-        scoped_chat.append({
-            "insight_id": idx,
-            "insight_code": insight["code"],
-            "allowed_questions": [
-                "WHY_RISKY",
-                "WHAT_TO_DO",
-                "WHAT_COULD_GO_WRONG",
-                "HOW_TO_MONITOR",
-            ],
-        })
+    if "scoped_chat" in steps:
+        start("scoped_chat")
+        for idx, insight in enumerate(insights):
+            scoped_chat.append({
+                "insight_id": idx,
+                "insight_code": insight["code"],
+                "allowed_questions": [
+                    "WHY_RISKY",
+                    "WHAT_TO_DO",
+                    "WHAT_COULD_GO_WRONG",
+                    "HOW_TO_MONITOR",
+                ],
+            })
 
     # --------------------------------------------------
-    # Final response (stable contract)
+    # Final response (stable contract, requested sections only)
     # --------------------------------------------------
-    return {
-        "ingestion": ingestion_meta,
+    payload = {
         "dataset": dataset_profile,
         "time_series": time_series_result,
         "columns": column_profiles,
@@ -120,3 +306,14 @@ async def ingest_csv(file: UploadFile):
         "next_steps": next_steps,  # 🔥 Phase 2 output
         "scoped_chat": scoped_chat,
     }
+    result = {"ingestion": ingestion_meta, **{section: payload[section] for section in sections}}
+
+    if key is not None:
+        result_cache.put(key, result)
+    ingestion_meta["cache"] = {"hit": False, "tier": None, "key": key}
+
+    if timings:
+        timer.finish()
+        result["timings"] = timer.timings()
+
+    return result
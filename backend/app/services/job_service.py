@@ -0,0 +1,121 @@
+# app/services/job_service.py
+import io
+from typing import Dict, Optional
+
+from fastapi import HTTPException, UploadFile
+
+from app.services.ingestion_service import PIPELINE_STAGES, run_ingestion_pipeline
+from app.services.job_store import job_store
+from app.services.metrics import StageTimer
+from app.services.worker_pool import PoolSaturated, ingest_pool
+from app.utils.limits import INGEST_RETRY_AFTER_SECONDS
+
+
+class _JobProgress:
+    """
+    Mirrors the pipeline's StageTimer into the job: current stage,
+    progress and per-stage wall-clock timings.
+    """
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self._timer: Optional[StageTimer] = None
+
+    def __call__(self, stage: str, timer: StageTimer) -> None:
+        self._timer = timer
+        job_store.update(
+            self.job_id,
+            stage=stage,
+            progress=round(PIPELINE_STAGES.index(stage) / len(PIPELINE_STAGES), 2),
+            stage_timings=self.timings,
+        )
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        # The pipeline finishes its timer on exit, so the last stage is included
+        if self._timer is None:
+            return {}
+        return {stage: timing["wall_seconds"] for stage, timing in self._timer.stages.items()}
+
+
+def _take_upload(file: UploadFile) -> UploadFile:
+    """
+    The request's upload is closed once the response is sent, so the job
+    takes over its spooled file (no copy) and leaves an empty one behind.
+    """
+    upload = UploadFile(file=file.file, filename=file.filename, size=file.size)
+    file.file = io.BytesIO()
+    upload.file.seek(0)
+    return upload
+
+
+def _run_job(job_id: str, upload: UploadFile) -> None:
+    progress = _JobProgress(job_id)
+    job_store.update(job_id, status="running")
+
+    try:
+        result = run_ingestion_pipeline(upload, progress=progress)
+        job_store.set_result(job_id, result)
+        job_store.update(
+            job_id,
+            status="done",
+            stage=None,
+            progress=1.0,
+            stage_timings=progress.timings,
+        )
+    except HTTPException as e:
+        job_store.update(
+            job_id,
+            status="failed",
+            stage_timings=progress.timings,
+            error={"status_code": e.status_code, "detail": e.detail},
+        )
+    except Exception as e:
+        job_store.update(
+            job_id,
+            status="failed",
+            stage_timings=progress.timings,
+            error={"status_code": 500, "detail": str(e)},
+        )
+    finally:
+        upload.file.close()
+
+
+def submit_ingestion_job(file: UploadFile) -> Dict:
+    upload = _take_upload(file)
+    job = job_store.create(filename=file.filename)
+
+    try:
+        ingest_pool.submit(_run_job, job["job_id"], upload)
+    except PoolSaturated:
+        job_store.delete(job["job_id"])
+        upload.file.close()
+        raise HTTPException(
+            status_code=503,
+            detail="Ingestion capacity reached, please retry shortly",
+            headers={"Retry-After": str(INGEST_RETRY_AFTER_SECONDS)},
+        )
+
+    return job
+
+
+def get_ingestion_job(job_id: str) -> Dict:
+    job = job_store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown ingestion job")
+    return job
+
+
+def get_ingestion_result(job_id: str) -> Dict:
+    job = get_ingestion_job(job_id)
+
+    if job["status"] == "failed":
+        raise HTTPException(**job["error"])
+    if job["status"] != "done":
+        raise HTTPException(status_code=409, detail=f"Job is {job['status']}")
+
+    # The job can expire between the status check and this read
+    result = job_store.get_result(job_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Unknown ingestion job")
+    return result
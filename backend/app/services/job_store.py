@@ -0,0 +1,125 @@
+# app/services/job_store.py
+import copy
+import threading
+from abc import ABC, abstractmethod
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from app.utils.limits import INGEST_JOB_STORE, INGEST_JOB_TTL_SECONDS
+
+FINISHED_STATUSES = {"done", "failed"}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class JobStore(ABC):
+    """
+    Storage contract for background ingestion jobs.
+
+    A job is a plain dict (status, stage, progress, stage_timings, error);
+    results are stored separately because they are large and only read
+    once. A shared backend (e.g. Redis) implements the same methods.
+    """
+
+    @abstractmethod
+    def create(self, **fields) -> Dict:
+        ...
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Dict]:
+        ...
+
+    @abstractmethod
+    def update(self, job_id: str, **fields) -> None:
+        ...
+
+    @abstractmethod
+    def set_result(self, job_id: str, result: Dict) -> None:
+        ...
+
+    @abstractmethod
+    def get_result(self, job_id: str) -> Optional[Dict]:
+        ...
+
+    @abstractmethod
+    def delete(self, job_id: str) -> None:
+        ...
+
+
+class InMemoryJobStore(JobStore):
+    """
+    Process-local job store. Finished jobs expire after `ttl_seconds`.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._jobs: Dict[str, Dict] = {}
+        self._results: Dict[str, Dict] = {}
+        self._finished_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _purge_expired(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        for job_id in [j for j, t in self._finished_at.items() if t < cutoff]:
+            self._jobs.pop(job_id, None)
+            self._results.pop(job_id, None)
+            self._finished_at.pop(job_id, None)
+
+    def create(self, **fields) -> Dict:
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "status": "queued",
+            "stage": None,
+            "progress": 0.0,
+            "stage_timings": {},
+            "error": None,
+            "created_at": _now(),
+            "updated_at": _now(),
+            **fields,
+        }
+        with self._lock:
+            self._purge_expired()
+            self._jobs[job["job_id"]] = job
+        return copy.deepcopy(job)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return copy.deepcopy(job) if job is not None else None
+
+    def update(self, job_id: str, **fields) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(fields, updated_at=_now())
+            if job["status"] in FINISHED_STATUSES:
+                self._finished_at.setdefault(job_id, time.monotonic())
+
+    def set_result(self, job_id: str, result: Dict) -> None:
+        with self._lock:
+            if job_id in self._jobs:
+                self._results[job_id] = result
+
+    def get_result(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            return self._results.get(job_id)
+
+    def delete(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+            self._results.pop(job_id, None)
+            self._finished_at.pop(job_id, None)
+
+
+def create_job_store(kind: str) -> JobStore:
+    if kind == "memory":
+        return InMemoryJobStore(ttl_seconds=INGEST_JOB_TTL_SECONDS)
+    raise ValueError(f"Unsupported job store backend: {kind}")
+
+
+job_store = create_job_store(INGEST_JOB_STORE)
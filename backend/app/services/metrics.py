@@ -0,0 +1,241 @@
+# app/services/metrics.py
+import bisect
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from app.utils.limits import INGEST_TRACE_MEMORY
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+BYTES_BUCKETS = tuple(4 ** p * 1024 for p in range(12))       # 1 KiB .. 4 GiB
+ROWS_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+COLUMNS_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1_000)
+
+# ru_maxrss is KiB on Linux, bytes on macOS
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def _peak_rss() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_UNIT
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+# --------------------------------------------------
+# Metric types (Prometheus text exposition format)
+# --------------------------------------------------
+class Histogram:
+    """
+    Cumulative-bucket histogram with an optional single label.
+    """
+
+    def __init__(self, name: str, help: str, buckets: Sequence[float], label: Optional[str] = None):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self.label = label
+        self._series: Dict[Optional[str], List] = {}   # label value -> [bucket counts, sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, label_value: Optional[str] = None) -> None:
+        with self._lock:
+            series = self._series.setdefault(label_value, [[0] * len(self.buckets), 0.0, 0])
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for label_value, (counts, total, count) in sorted(self._series.items(), key=lambda s: str(s[0])):
+                labels = {self.label: label_value} if self.label else {}
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    bucket_labels = _format_labels({**labels, "le": _format_value(bound)})
+                    lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+                lines.append(f"{self.name}_bucket{_format_labels({**labels, 'le': '+Inf'})} {count}")
+                lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+                lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name: str, help: str, label: Optional[str] = None):
+        self.name = name
+        self.help = help
+        self.label = label
+        self._values: Dict[Optional[str], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, label_value: Optional[str] = None, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_value] = self._values.get(label_value, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for label_value, value in sorted(self._values.items(), key=lambda v: str(v[0])):
+                labels = {self.label: label_value} if self.label else {}
+                lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+STAGE_WALL_SECONDS = Histogram(
+    "byod_ingest_stage_wall_seconds", "Wall-clock time per pipeline stage.", SECONDS_BUCKETS, "stage"
+)
+STAGE_CPU_SECONDS = Histogram(
+    "byod_ingest_stage_cpu_seconds", "CPU time of the pipeline thread per stage.", SECONDS_BUCKETS, "stage"
+)
+STAGE_RSS_GROWTH_BYTES = Histogram(
+    "byod_ingest_stage_peak_rss_growth_bytes", "Growth of the process peak RSS during a stage.",
+    BYTES_BUCKETS, "stage",
+)
+STAGE_TRACEMALLOC_PEAK_BYTES = Histogram(
+    "byod_ingest_stage_tracemalloc_peak_bytes",
+    "Peak traced Python allocations above the stage start (INGEST_TRACE_MEMORY=1).",
+    BYTES_BUCKETS, "stage",
+)
+REQUEST_SECONDS = Histogram(
+    "byod_ingest_request_seconds", "Wall-clock time of a whole ingestion.", SECONDS_BUCKETS, "outcome"
+)
+INPUT_BYTES = Histogram("byod_ingest_input_bytes", "Uploaded CSV size.", BYTES_BUCKETS)
+INPUT_ROWS = Histogram("byod_ingest_input_rows", "Rows in the uploaded CSV.", ROWS_BUCKETS)
+INPUT_COLUMNS = Histogram("byod_ingest_input_columns", "Columns in the uploaded CSV.", COLUMNS_BUCKETS)
+REQUESTS = Counter("byod_ingest_requests_total", "Ingestions by outcome.", "outcome")
+
+REGISTRY = (
+    REQUESTS, REQUEST_SECONDS, STAGE_WALL_SECONDS, STAGE_CPU_SECONDS,
+    STAGE_RSS_GROWTH_BYTES, STAGE_TRACEMALLOC_PEAK_BYTES,
+    INPUT_BYTES, INPUT_ROWS, INPUT_COLUMNS,
+)
+
+if INGEST_TRACE_MEMORY and not tracemalloc.is_tracing():
+    tracemalloc.start()
+
+
+# --------------------------------------------------
+# Per-request stage recorder
+# --------------------------------------------------
+class StageTimer:
+    """
+    Records wall time, thread CPU time and memory growth per stage of
+    one pipeline run; `start(stage)` closes the previous stage.
+
+    Peak RSS and tracemalloc are process-wide, so with several pipelines
+    running at once their growth is shared between the stages that
+    overlap.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.input: Dict[str, int] = {}
+        self.outcome = "ok"
+        self._started_at = time.perf_counter()
+        self._stage: Optional[str] = None
+        self._marks: Tuple = ()
+
+    def start(self, stage: str) -> None:
+        self._close_stage()
+        # Only when we own tracing: resetting the peak would disturb other tracers
+        traced = INGEST_TRACE_MEMORY and tracemalloc.is_tracing()
+        if traced:
+            tracemalloc.reset_peak()
+        self._stage = stage
+        self._marks = (
+            time.perf_counter(),
+            time.thread_time(),
+            _peak_rss(),
+            tracemalloc.get_traced_memory()[0] if traced else None,
+        )
+
+    def _close_stage(self) -> None:
+        if self._stage is None:
+            return
+        wall, cpu, rss, traced = self._marks
+        timing = {
+            "wall_seconds": round(time.perf_counter() - wall, 4),
+            "cpu_seconds": round(time.thread_time() - cpu, 4),
+            "peak_rss_growth_bytes": _peak_rss() - rss,
+        }
+        if traced is not None:
+            timing["tracemalloc_peak_bytes"] = max(tracemalloc.get_traced_memory()[1] - traced, 0)
+        self.stages[self._stage] = timing
+        self._stage = None
+
+    def finish(self) -> None:
+        self._close_stage()
+
+    @property
+    def total_seconds(self) -> float:
+        return time.perf_counter() - self._started_at
+
+    def timings(self) -> Dict:
+        return {
+            "total_seconds": round(self.total_seconds, 4),
+            "stages": self.stages,
+            "input": self.input,
+        }
+
+
+def record(timer: StageTimer) -> None:
+    """
+    Fold one finished pipeline run into the process-wide histograms.
+    """
+    timer.finish()
+    REQUESTS.inc(timer.outcome)
+    REQUEST_SECONDS.observe(timer.total_seconds, timer.outcome)
+
+    for stage, timing in timer.stages.items():
+        STAGE_WALL_SECONDS.observe(timing["wall_seconds"], stage)
+        STAGE_CPU_SECONDS.observe(timing["cpu_seconds"], stage)
+        STAGE_RSS_GROWTH_BYTES.observe(timing["peak_rss_growth_bytes"], stage)
+        if "tracemalloc_peak_bytes" in timing:
+            STAGE_TRACEMALLOC_PEAK_BYTES.observe(timing["tracemalloc_peak_bytes"], stage)
+
+    for histogram, key in ((INPUT_BYTES, "bytes"), (INPUT_ROWS, "rows"), (INPUT_COLUMNS, "columns")):
+        if key in timer.input:
+            histogram.observe(timer.input[key])
+
+
+@contextmanager
+def instrumented() -> Iterator[StageTimer]:
+    """
+    Timer for one pipeline run, recorded on exit; an exception marks
+    the run as an error (HTTP errors keep their status code).
+    """
+    timer = StageTimer()
+    try:
+        yield timer
+    except Exception as e:
+        status_code = getattr(e, "status_code", None)
+        timer.outcome = f"http_{status_code}" if status_code else "error"
+        raise
+    finally:
+        record(timer)
+
+
+def render_metrics() -> str:
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,160 @@
+# app/services/result_cache.py
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from app.engine import (
+    anomaly_engine, csv_parser, column_summary, duplicate_engine, sketches, time_series_engine,
+)
+from app.utils.limits import INGEST_CACHE_MAX_BYTES, INGEST_CACHE_PATH
+from app.utils.serialization import dumps
+
+CACHE_VERSION = 2            # bump when the response contract changes
+HASH_BLOCK_BYTES = 1024 * 1024
+
+
+def engine_fingerprint() -> Dict:
+    """
+    Configuration that changes pipeline output; part of every cache key.
+    """
+    return {
+        "version": CACHE_VERSION,
+        "csv_engine": csv_parser.resolve_engine(),
+        "pyarrow": csv_parser.pa.__version__ if csv_parser.pa is not None else None,
+        "max_rows": csv_parser.MAX_ROWS,
+        "sample_seed": csv_parser.SAMPLE_SEED,
+        "chunk_rows": csv_parser.CHUNK_ROWS,
+        "streaming_threshold": csv_parser.STREAMING_THRESHOLD_BYTES,
+        "iqr_multiplier": column_summary.IQR_MULTIPLIER,
+        "profile_sketches": sketches.PROFILE_SKETCHES,
+        "date_parse_threshold": time_series_engine.DATE_PARSE_THRESHOLD,
+        "date_probe_size": time_series_engine.DATE_PROBE_SIZE,
+        "fill_ratio_target": time_series_engine.FILL_RATIO_TARGET,
+        "max_primary_periods": time_series_engine.MAX_PRIMARY_PERIODS,
+        "business_day_min_periods": time_series_engine.BUSINESS_DAY_MIN_PERIODS,
+        "anomaly_z_threshold": anomaly_engine.Z_THRESHOLD,
+        "anomaly_window": anomaly_engine.ROLLING_WINDOW,
+        "cusum_threshold": anomaly_engine.CUSUM_THRESHOLD,
+        "max_point_anomalies": anomaly_engine.MAX_POINT_ANOMALIES,
+        "short_series_change": anomaly_engine.SHORT_SERIES_CHANGE,
+        "max_metrics": time_series_engine.MAX_METRICS,
+        "duplicate_key_columns": duplicate_engine.DUPLICATE_KEY_COLUMNS,
+        "duplicate_verify": duplicate_engine.DUPLICATE_VERIFY,
+    }
+
+
+def cache_key(fileobj, options: Optional[Dict] = None) -> str:
+    """
+    Streaming SHA-256 of the upload bytes plus the engine fingerprint
+    and the request options (column selection, sections).
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(engine_fingerprint(), sort_keys=True).encode())
+    digest.update(json.dumps(options or {}, sort_keys=True).encode())
+
+    fileobj.seek(0)
+    for block in iter(lambda: fileobj.read(HASH_BLOCK_BYTES), b""):
+        digest.update(block)
+    fileobj.seek(0)
+
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier cache of serialized ingestion responses.
+
+    Memory tier: LRU bounded by total JSON bytes.
+    Disk tier (optional): SQLite table, promoted to memory on hit.
+    Values are stored as JSON text so every hit returns a fresh object.
+    """
+
+    def __init__(self, max_bytes: int, path: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._db = None
+
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, payload TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 or self._db is not None
+
+    def disable(self) -> None:
+        """
+        Turn both tiers off for this process (benchmarks); the SQLite
+        file itself is left as it is.
+        """
+        with self._lock:
+            self.max_bytes = 0
+            self._entries.clear()
+            self._bytes = 0
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def get(self, key: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Returns (result, tier) with tier in {"memory", "disk"}, or (None, None).
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                return json.loads(payload), "memory"
+
+            if self._db is None:
+                return None, None
+
+            row = self._db.execute(
+                "SELECT payload FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None, None
+
+            self._remember(key, row[0])
+            return json.loads(row[0]), "disk"
+
+    def put(self, key: str, result: Dict) -> None:
+        payload = dumps(result).decode()
+
+        with self._lock:
+            self._remember(key, payload)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results (key, payload) VALUES (?, ?)",
+                    (key, payload),
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, payload: str) -> None:
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+
+        self._entries[key] = payload
+        self._bytes += size
+
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+
+
+result_cache = ResultCache(
+    max_bytes=INGEST_CACHE_MAX_BYTES,
+    path=INGEST_CACHE_PATH,
+)
@@ -0,0 +1,61 @@
+# app/services/worker_pool.py
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from app.utils.limits import INGEST_MAX_QUEUE, INGEST_MAX_WORKERS
+
+
+class PoolSaturated(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class BoundedWorkerPool:
+    """
+    Thread pool with a hard cap on admitted work.
+
+    At most `max_workers` jobs run and `max_queue` more wait; anything
+    beyond that is rejected immediately so the event loop never blocks
+    and callers can answer with 503 + Retry-After.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="ingest",
+        )
+        self._lock = threading.Lock()
+        self._admitted = 0
+
+    @property
+    def admitted(self) -> int:
+        return self._admitted
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._admitted -= 1
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Admit work without waiting for it; raises PoolSaturated when full.
+        """
+        with self._lock:
+            if self._admitted >= self.max_workers + self.max_queue:
+                raise PoolSaturated()
+            self._admitted += 1
+
+        future = self._executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(self, fn: Callable, *args, **kwargs):
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+
+ingest_pool = BoundedWorkerPool(
+    max_workers=INGEST_MAX_WORKERS,
+    max_queue=INGEST_MAX_QUEUE,
+)
@@ -0,0 +1,41 @@
+# app/utils/limits.py
+import os
+
+# --------------------------------------------------
+# Ingestion worker pool
+# --------------------------------------------------
+# Pipelines running at once per uvicorn worker
+INGEST_MAX_WORKERS = int(os.getenv("INGEST_MAX_WORKERS", "2"))
+
+# Uploads allowed to wait for a free worker before we shed load
+INGEST_MAX_QUEUE = int(os.getenv("INGEST_MAX_QUEUE", "8"))
+
+# Seconds clients are told to wait when the pool is saturated
+INGEST_RETRY_AFTER_SECONDS = int(os.getenv("INGEST_RETRY_AFTER_SECONDS", "5"))
+
+# --------------------------------------------------
+# Ingestion result cache
+# --------------------------------------------------
+# In-memory tier budget (serialized JSON bytes); 0 disables caching
+INGEST_CACHE_MAX_BYTES = int(os.getenv("INGEST_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Optional SQLite file for a persistent second tier
+INGEST_CACHE_PATH = os.getenv("INGEST_CACHE_PATH") or None
+
+# --------------------------------------------------
+# Background ingestion jobs
+# --------------------------------------------------
+# Job store backend ("memory" is the only built-in one)
+INGEST_JOB_STORE = os.getenv("INGEST_JOB_STORE", "memory")
+
+# Finished jobs (and their results) are kept this long, in seconds
+INGEST_JOB_TTL_SECONDS = int(os.getenv("INGEST_JOB_TTL_SECONDS", "3600"))
+
+# --------------------------------------------------
+# Instrumentation
+# --------------------------------------------------
+# Trace Python allocations per stage (tracemalloc slows the pipeline noticeably)
+INGEST_TRACE_MEMORY = os.getenv("INGEST_TRACE_MEMORY", "0") == "1"
+
+# Check every ingestion response against app/models/schemas.py (CI / debugging)
+INGEST_VALIDATE_RESPONSE = os.getenv("INGEST_VALIDATE_RESPONSE", "0") == "1"
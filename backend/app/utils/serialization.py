@@ -0,0 +1,50 @@
+# app/utils/serialization.py
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pydantic_core
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _fallback(value: Any) -> Any:
+    """
+    Types the fast encoders do not know natively.
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if value is pd.NA or value is pd.NaT:
+        return None
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    JSON-encode a payload of dicts / lists / scalars in one native pass
+    (orjson when installed, otherwise pydantic-core), without FastAPI's
+    recursive jsonable_encoder. NumPy scalars are encoded as numbers and
+    NaN / inf as null.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            content,
+            default=_fallback,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return pydantic_core.to_json(content, fallback=_fallback, inf_nan_mode="null")
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,84 @@
+# benchmarks/bench_csv_engines.py
+"""
+Parse time and peak resident memory of the pandas vs pyarrow CSV engines.
+
+Each engine runs in a fresh subprocess so peak RSS is not shared.
+
+Usage (from backend/):
+    python -m benchmarks.bench_csv_engines --rows 1000000
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.datasets import generate_csv
+
+
+def _peak_rss_mb() -> float:
+    # VmHWM belongs to this process image; ru_maxrss would also count the
+    # parent's high-water mark inherited through fork/exec.
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _child(engine: str, path: str) -> None:
+    from fastapi import UploadFile
+    from app.engine import csv_parser
+
+    # Keep every row so the resident frame reflects the engine, not sampling
+    csv_parser.MAX_ROWS = sys.maxsize
+    baseline_rss = _peak_rss_mb()
+
+    with open(path, "rb") as handle:
+        start = time.perf_counter()
+        df, meta = csv_parser.parse_csv(UploadFile(file=handle, filename="bench.csv"), streaming=False, engine=engine)
+        elapsed = time.perf_counter() - start
+
+    print(json.dumps({
+        "engine": meta["engine"],
+        "seconds": round(elapsed, 3),
+        "peak_rss_mb": round(_peak_rss_mb() - baseline_rss, 1),
+        "frame_mb": round(df.memory_usage(deep=True).sum() / 2**20, 1),
+        "rows": meta["total_rows"],
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--child", nargs=2, metavar=("ENGINE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(*args.child)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "mixed.csv")
+        generate_csv(path, rows=args.rows, numeric=2, integer=2, categorical=2, text=1)
+        size_mb = os.path.getsize(path) / 2**20
+        print(f"{args.rows:,} rows, {size_mb:.0f} MB")
+        print(f"{'engine':>8} {'parse_s':>8} {'peak_rss_mb':>12} {'frame_mb':>9}  (rss above interpreter baseline)")
+
+        for engine in ("pandas", "pyarrow"):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_csv_engines", "--child", engine, path],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{result['engine']:>8} {result['seconds']:>8.2f} {result['peak_rss_mb']:>12.0f} {result['frame_mb']:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# benchmarks/bench_datetime_probe.py
+"""
+Date-column detection on frames with many free-text columns: full
+inference parse of every candidate vs sampled format probing.
+
+The date column is placed last, so both strategies visit every text
+column first (the worst case for detect_time_series).
+
+Usage (from backend/):
+    python -m benchmarks.bench_datetime_probe --rows 50000 --text-columns 5 20 50
+"""
+import argparse
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from app.engine.time_series_engine import DATE_PARSE_THRESHOLD, _try_parse_datetime
+from benchmarks.harness import best_of
+
+WORDS = np.array(
+    ["order", "late", "refund", "call back", "no answer", "priority", "ticket 42",
+     "see note", "v2 rollout", "ok", "escalated", "duplicate"],
+    dtype=object,
+)
+
+
+def _text_frame(rows: int, text_columns: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(text_columns):
+        first = WORDS[rng.integers(0, len(WORDS), rows)]
+        second = WORDS[rng.integers(0, len(WORDS), rows)]
+        data[f"text_{i}"] = first + " " + second
+    days = rng.integers(0, 730, rows)
+    data["order_date"] = (pd.Timestamp("2022-01-01") + pd.to_timedelta(days, unit="D")).strftime("%Y-%m-%d")
+    return pd.DataFrame(data)
+
+
+def _legacy_detect(df: pd.DataFrame):
+    # Previous behaviour: full inference parse of each candidate in turn
+    for col in df.columns:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            parsed = pd.to_datetime(df[col], errors="coerce")
+        if parsed.notna().mean() >= DATE_PARSE_THRESHOLD:
+            return col
+    return None
+
+
+def _probed_detect(df: pd.DataFrame):
+    for col in df.columns:
+        if _try_parse_datetime(df[col]) is not None:
+            return col
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--text-columns", type=int, nargs="+", default=[5, 20, 50])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'text_cols':>9} {'legacy_s':>9} {'probed_s':>9} {'speedup':>8} {'column':>11}")
+    for text_columns in args.text_columns:
+        df = _text_frame(args.rows, text_columns)
+
+        legacy, legacy_col = best_of(lambda: _legacy_detect(df), args.repeat)
+        probed, probed_col = best_of(lambda: _probed_detect(df), args.repeat)
+        assert legacy_col == probed_col, (legacy_col, probed_col)
+
+        print(f"{text_columns:>9} {legacy:>9.3f} {probed:>9.3f} {legacy / probed:>7.1f}x {probed_col:>11}")
+
+
+if __name__ == "__main__":
+    main()
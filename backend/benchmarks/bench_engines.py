@@ -0,0 +1,121 @@
+# benchmarks/bench_engines.py
+"""
+Time and peak memory of every engine stage on its own, then of the
+whole ingestion pipeline, on one synthetic CSV.
+
+Each stage gets the real output of the stages before it, computed once
+up front, so a stage's number reflects only its own work.
+
+Usage (from backend/):
+    python -m benchmarks.bench_engines --rows 200000 --output results.json
+    python -m benchmarks.compare base.json results.json
+"""
+import argparse
+import os
+import tempfile
+
+from fastapi import UploadFile
+
+from app.engine.chart_mapper import map_insights_to_charts
+from app.engine.column_summary import summarize_columns
+from app.engine.csv_parser import parse_csv
+from app.engine.decision_engine import generate_next_steps
+from app.engine.duplicate_engine import find_duplicates
+from app.engine.full_stats import FullDataStats
+from app.engine.insight_engine import generate_insights
+from app.engine.memory_optimizer import optimize_frame
+from app.engine.profiler import profile_columns
+from app.engine.time_series_engine import detect_time_series
+from app.engine.type_inference import infer_types
+from app.engine.validator import validate_dataset
+from app.services import ingestion_service
+from app.services.result_cache import result_cache
+from benchmarks import datasets
+from benchmarks.harness import measure, write_results
+
+
+def _parse(path: str, accumulator=None):
+    with open(path, "rb") as handle:
+        return parse_csv(UploadFile(file=handle, filename="bench.csv"), accumulator=accumulator)
+
+
+def _pipeline(path: str):
+    with open(path, "rb") as handle:
+        return ingestion_service.run_ingestion_pipeline(UploadFile(file=handle, filename="bench.csv"))
+
+
+def _stages(path: str):
+    """
+    (name, fn) for each stage, in pipeline order.
+    """
+    df, meta = _parse(path)
+    df, _ = optimize_frame(df)
+    summaries = summarize_columns(df)
+    column_types = infer_types(df, summaries)
+    column_profiles = profile_columns(df, column_types, summaries)
+    dataset_issues = validate_dataset(df, summaries)
+    duplicates = find_duplicates(df)
+    dataset_profile = {
+        "rows_analyzed": len(df),
+        "columns": len(df.columns),
+        "duplicate_rows": duplicates["duplicate_rows"],
+        "missing_cells_percentage": float(df.isna().mean().mean() * 100),
+    }
+    time_series = detect_time_series(df, column_profiles)
+    insights = generate_insights(dataset_profile, column_profiles, dataset_issues, time_series, meta)
+    raw, _ = _parse(path)
+
+    return [
+        ("parse_csv", lambda: _parse(path)),
+        ("parse_csv+full_stats", lambda: _parse(path, FullDataStats())),
+        ("optimize_frame", lambda: optimize_frame(raw)),
+        ("summarize_columns", lambda: summarize_columns(df)),
+        ("validate_dataset", lambda: validate_dataset(df, summaries)),
+        ("infer_types", lambda: infer_types(df, summaries)),
+        ("profile_columns", lambda: profile_columns(df, column_types, summaries)),
+        ("find_duplicates", lambda: find_duplicates(df)),
+        ("detect_time_series", lambda: detect_time_series(df, column_profiles)),
+        ("generate_insights", lambda: generate_insights(
+            dataset_profile, column_profiles, dataset_issues, time_series, meta
+        )),
+        ("map_insights_to_charts", lambda: map_insights_to_charts(insights, column_profiles, time_series)),
+        ("generate_next_steps", lambda: generate_next_steps(insights)),
+        ("pipeline", lambda: _pipeline(path)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    datasets.add_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced peak-memory run")
+    parser.add_argument("--only", nargs="+", metavar="STAGE", help="benchmark these stages only")
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    # Every pipeline run must do the work, not hit the result cache
+    result_cache.disable()
+
+    spec = datasets.spec_from_args(args)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = datasets.generate_csv(os.path.join(tmp, "bench.csv"), args.encoding, **spec)
+        size_mb = os.path.getsize(path) / 2**20
+        print(f"{args.rows:,} rows, {size_mb:.1f} MB, {args.encoding}")
+        print(f"{'stage':<24} {'seconds':>9} {'peak_mb':>9}")
+
+        results = []
+        for name, fn in _stages(path):
+            if args.only and name not in args.only:
+                continue
+            result = {"stage": name, **measure(fn, args.repeat, memory=not args.no_memory)}
+            results.append(result)
+            print(f"{name:<24} {result['seconds']:>9.4f} {result.get('peak_mb', float('nan')):>9.1f}")
+
+    if args.output:
+        config = {**spec, "encoding": args.encoding, "file_mb": round(size_mb, 2), "repeat": args.repeat}
+        write_results(args.output, "engines", config, results)
+        print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
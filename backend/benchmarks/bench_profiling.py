@@ -0,0 +1,50 @@
+# benchmarks/bench_profiling.py
+"""
+Per-column vs batched column summaries as the frame gets wider.
+
+Usage (from backend/):
+    python -m benchmarks.bench_profiling --rows 10000 --columns 50 200 500 1000 2000
+"""
+import argparse
+
+import pandas as pd
+
+from app.engine.column_summary import summarize_columns
+from app.engine.profiler import profile_columns
+from app.engine.type_inference import infer_types
+from benchmarks.datasets import generate_frame
+from benchmarks.harness import best_of
+
+
+def _wide_frame(rows: int, columns: int, text_share: float = 0.3, seed: int = 0) -> pd.DataFrame:
+    n_text = int(columns * text_share)
+    return generate_frame(
+        rows, numeric=columns - n_text, integer=0, categorical=n_text, text=0, dates=0,
+        cardinality=50, seed=seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--columns", type=int, nargs="+", default=[50, 200, 500, 1000, 2000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'columns':>8} {'per_column_s':>13} {'batched_s':>10} {'speedup':>8} {'profile_s':>10}")
+    for columns in args.columns:
+        df = _wide_frame(args.rows, columns)
+
+        per_column, _ = best_of(lambda: summarize_columns(df, batched=False), args.repeat)
+        batched, _ = best_of(lambda: summarize_columns(df, batched=True), args.repeat)
+
+        def full_profile():
+            summaries = summarize_columns(df, batched=True)
+            profile_columns(df, infer_types(df, summaries), summaries)
+
+        profile, _ = best_of(full_profile, args.repeat)
+        print(f"{columns:>8} {per_column:>13.3f} {batched:>10.3f} {per_column / batched:>7.1f}x {profile:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# benchmarks/bench_serialization.py
+"""
+Time turning a real ingestion payload into JSON bytes: FastAPI's
+default path (jsonable_encoder + json.dumps) against the fast path in
+app/utils/serialization.py (orjson, and pydantic-core as the fallback).
+
+The payload comes from running the pipeline on a wide synthetic CSV
+(1,000 columns by default). Every encoder's output is decoded and
+compared with the default path, and the payload is checked against
+IngestionResponse.
+
+Usage (from backend/):
+    python -m benchmarks.bench_serialization --rows 2000 --output results.json
+"""
+import argparse
+import json
+import os
+import tempfile
+
+import pydantic_core
+from fastapi import UploadFile
+from fastapi.encoders import jsonable_encoder
+
+from app.models.schemas import IngestionResponse
+from app.services import ingestion_service
+from app.services.result_cache import result_cache
+from app.utils import serialization
+from benchmarks import datasets
+from benchmarks.harness import measure, write_results
+
+# 1 date + 500 numeric + 200 integer + 250 categorical + 49 text = 1,000 columns
+WIDE_DEFAULTS = {"rows": 2_000, "numeric": 500, "integer": 200, "categorical": 250, "text": 49, "dates": 1}
+
+
+def _payload(path: str) -> dict:
+    with open(path, "rb") as handle:
+        return ingestion_service.run_ingestion_pipeline(UploadFile(file=handle, filename="bench.csv"))
+
+
+def _encoders():
+    """
+    (name, fn) for each way of producing response bytes.
+    """
+    encoders = [
+        ("jsonable_encoder+json", lambda payload: json.dumps(jsonable_encoder(payload)).encode()),
+        ("pydantic_core", lambda payload: pydantic_core.to_json(
+            payload, fallback=serialization._fallback, inf_nan_mode="null"
+        )),
+        ("model_dump_json", lambda payload: (
+            IngestionResponse.model_validate(payload).model_dump_json(exclude_unset=True).encode()
+        )),
+    ]
+    if serialization.orjson is not None:
+        encoders.insert(1, ("orjson", serialization.dumps))
+    return encoders
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    datasets.add_arguments(parser)
+    parser.set_defaults(**WIDE_DEFAULTS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced peak-memory run")
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    # The payload must come from a real run, not the result cache
+    result_cache.disable()
+
+    spec = datasets.spec_from_args(args)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = datasets.generate_csv(os.path.join(tmp, "bench.csv"), args.encoding, **spec)
+        payload = _payload(path)
+
+    IngestionResponse.model_validate(payload)
+    expected = json.loads(json.dumps(jsonable_encoder(payload)))
+    size_mb = len(serialization.dumps(payload)) / 2**20
+    print(f"{len(payload['columns']):,} columns, {args.rows:,} rows, {size_mb:.2f} MB of JSON")
+    print(f"{'encoder':<24} {'seconds':>9} {'peak_mb':>9} {'speedup':>8}")
+
+    results, baseline = [], None
+    for name, fn in _encoders():
+        if json.loads(fn(payload)) != expected:
+            raise SystemExit(f"{name}: output differs from jsonable_encoder+json")
+        result = {"encoder": name, **measure(lambda: fn(payload), args.repeat, memory=not args.no_memory)}
+        baseline = baseline or result["seconds"]
+        result["speedup"] = round(baseline / result["seconds"], 2) if result["seconds"] else None
+        results.append(result)
+        print(
+            f"{name:<24} {result['seconds']:>9.4f} {result.get('peak_mb', float('nan')):>9.1f} "
+            f"{result['speedup'] or float('nan'):>7.2f}x"
+        )
+
+    if args.output:
+        config = {**spec, "encoding": args.encoding, "json_mb": round(size_mb, 2), "repeat": args.repeat}
+        write_results(args.output, "serialization", config, results)
+        print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/compare.py
+"""
+Compare two benchmark result files stage by stage.
+
+A stage is a regression when it is both --threshold slower relative to
+the base and at least --min-seconds slower in absolute terms, so stages
+of a few milliseconds do not fail the gate on timer noise. Results that
+feed the gate should come from runs with --repeat 3 or more: each stage
+reports its best repeat, and a single repeat is as noisy as it gets.
+
+Usage (from backend/):
+    python -m benchmarks.compare base.json candidate.json --threshold 0.1 --min-seconds 0.005
+"""
+import argparse
+import json
+import sys
+
+MIN_REPEAT = 3          # fewer repeats than this get a warning
+
+
+def _load(path: str):
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def _rows(results):
+    # Timed rows keyed by their first field ("stage", "encoder", ...); rows
+    # without "seconds" (and non-list results, e.g. load tests) cannot be compared
+    if not isinstance(results, list):
+        return {}
+    return {
+        str(next(iter(row.values()))): row
+        for row in results
+        if isinstance(row, dict) and row and row.get("seconds") is not None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown reported as a regression")
+    parser.add_argument(
+        "--min-seconds", type=float, default=0.005, help="absolute slowdown a regression must also exceed"
+    )
+    args = parser.parse_args()
+
+    base, candidate = _load(args.base), _load(args.candidate)
+    base_rows, candidate_rows = _rows(base.get("results")), _rows(candidate.get("results"))
+    if not base_rows or not candidate_rows:
+        parser.error("both files need a list of result rows with a 'seconds' field")
+    if base.get("config") != candidate.get("config"):
+        print("warning: runs used different configs; ratios may not be comparable")
+    repeats = [(run.get("config") or {}).get("repeat") for run in (base, candidate)]
+    if any(repeat is not None and repeat < MIN_REPEAT for repeat in repeats):
+        print(f"warning: runs with fewer than {MIN_REPEAT} repeats are too noisy to gate on")
+    print(
+        f"base {base.get('environment', {}).get('commit')} -> "
+        f"candidate {candidate.get('environment', {}).get('commit')}"
+    )
+    print(f"{'name':<24} {'base_s':>9} {'cand_s':>9} {'ratio':>7} {'base_mb':>8} {'cand_mb':>8}")
+
+    regressions = []
+    for name, row in candidate_rows.items():
+        before = base_rows.get(name)
+        if before is None:
+            continue
+        if before["seconds"]:
+            ratio = row["seconds"] / before["seconds"]
+        else:
+            ratio = float("inf") if row["seconds"] else 1.0   # both below the timer resolution
+        flag = ""
+        if ratio > 1 + args.threshold and row["seconds"] - before["seconds"] >= args.min_seconds:
+            regressions.append(name)
+            flag = "  slower"
+        print(
+            f"{name:<24} {before['seconds']:>9.4f} {row['seconds']:>9.4f} {ratio:>6.2f}x "
+            f"{before.get('peak_mb', float('nan')):>8.1f} {row.get('peak_mb', float('nan')):>8.1f}{flag}"
+        )
+
+    # Non-zero exit so CI can gate on it
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# benchmarks/datasets.py
+"""
+Deterministic synthetic CSVs for the benchmarks.
+
+The same arguments (and seed) always give byte-identical output, so
+timings from different commits are taken on the same data.
+"""
+import argparse
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+CITIES = np.array(
+    ["Berlin", "Chennai", "Lagos", "Lima", "Osaka", "Toronto", "Zürich", "São Paulo"],
+    dtype=object,
+)
+WORDS = np.array(
+    ["order", "late", "refund", "call back", "no answer", "priority", "see note",
+     "escalated", "duplicate", "ok"],
+    dtype=object,
+)
+ENCODINGS = ("utf-8", "utf-8-sig", "latin1", "utf-16")
+
+
+def _with_nulls(values: np.ndarray, null_rate: float, rng: np.random.Generator) -> np.ndarray:
+    if null_rate <= 0:
+        return values
+    values = values.astype(object) if values.dtype.kind in "iub" else values.copy()
+    values[rng.random(len(values)) < null_rate] = None if values.dtype == object else np.nan
+    return values
+
+
+def _dates(
+    rows: int,
+    start: str,
+    days: int,
+    gap_rate: float,
+    hourly: bool,
+    rng: np.random.Generator,
+) -> pd.DatetimeIndex:
+    # Whole days are left out with probability gap_rate, so series have real gaps
+    calendar = np.flatnonzero(rng.random(days) >= gap_rate)
+    if calendar.size == 0:
+        calendar = np.array([0])
+    offsets = pd.to_timedelta(np.sort(rng.choice(calendar, rows)), unit="D")
+    if hourly:
+        offsets += pd.to_timedelta(rng.integers(0, 24, rows), unit="h")
+    return pd.Timestamp(start) + offsets
+
+
+def generate_frame(
+    rows: int = 100_000,
+    numeric: int = 4,
+    integer: int = 2,
+    categorical: int = 3,
+    text: int = 1,
+    boolean: int = 0,
+    dates: int = 1,
+    cardinality: int = 50,
+    null_rate: float = 0.05,
+    date_start: str = "2022-01-01",
+    date_days: int = 730,
+    gap_rate: float = 0.01,
+    hourly: bool = False,
+    duplicate_rate: float = 0.0,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Mixed-type frame: dates first, then numeric (float), integer,
+    categorical (`cardinality` distinct labels), free text (one label
+    per ~10 rows), boolean. `null_rate` applies to every non-date column;
+    `duplicate_rate` overwrites that share of rows with copies of others.
+    """
+    rng = np.random.default_rng(seed)
+    data = {}
+
+    for i in range(dates):
+        stamps = _dates(rows, date_start, date_days, gap_rate, hourly, rng)
+        data[f"date_{i}"] = stamps.strftime("%Y-%m-%d %H:%M:%S" if hourly else "%Y-%m-%d")
+    for i in range(numeric):
+        data[f"num_{i}"] = _with_nulls(np.round(rng.lognormal(3, 1, rows), 2), null_rate, rng)
+    for i in range(integer):
+        data[f"int_{i}"] = _with_nulls(rng.integers(0, 1_000, rows), null_rate, rng)
+
+    labels = np.array(
+        [f"{CITIES[k % len(CITIES)]} {k // len(CITIES)}" for k in range(cardinality)], dtype=object
+    )
+    for i in range(categorical):
+        # Zipf-like weights: a few dominant labels, a long tail
+        weights = 1.0 / np.arange(1, cardinality + 1)
+        data[f"cat_{i}"] = _with_nulls(
+            labels[rng.choice(cardinality, rows, p=weights / weights.sum())], null_rate, rng
+        )
+    for i in range(text):
+        first = WORDS[rng.integers(0, len(WORDS), rows)]
+        ticket = rng.integers(0, max(rows // 10, 1), rows).astype(str).astype(object)
+        data[f"text_{i}"] = _with_nulls(first + " #" + ticket, null_rate, rng)
+    for i in range(boolean):
+        data[f"flag_{i}"] = _with_nulls(rng.random(rows) < 0.3, null_rate, rng)
+
+    frame = pd.DataFrame(data)
+    if duplicate_rate > 0 and rows > 1:
+        order = np.arange(rows)
+        targets = rng.choice(rows, int(rows * duplicate_rate), replace=False)
+        order[targets] = rng.integers(0, rows, len(targets))
+        frame = frame.iloc[order].reset_index(drop=True)
+    return frame
+
+
+def write_csv(frame: pd.DataFrame, path: str, encoding: str = "utf-8") -> str:
+    frame.to_csv(path, index=False, encoding=encoding)
+    return path
+
+
+def generate_csv(path: str, encoding: str = "utf-8", **spec) -> str:
+    return write_csv(generate_frame(**spec), path, encoding)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Dataset options shared by every benchmark CLI.
+    """
+    group = parser.add_argument_group("dataset")
+    group.add_argument("--rows", type=int, default=100_000)
+    group.add_argument("--numeric", type=int, default=4)
+    group.add_argument("--integer", type=int, default=2)
+    group.add_argument("--categorical", type=int, default=3)
+    group.add_argument("--text", type=int, default=1)
+    group.add_argument("--boolean", type=int, default=0)
+    group.add_argument("--dates", type=int, default=1)
+    group.add_argument("--cardinality", type=int, default=50)
+    group.add_argument("--null-rate", type=float, default=0.05)
+    group.add_argument("--date-start", default="2022-01-01")
+    group.add_argument("--date-days", type=int, default=730)
+    group.add_argument("--gap-rate", type=float, default=0.01)
+    group.add_argument("--hourly", action="store_true")
+    group.add_argument("--duplicate-rate", type=float, default=0.0)
+    group.add_argument("--encoding", choices=ENCODINGS, default="utf-8")
+    group.add_argument("--seed", type=int, default=0)
+
+
+def spec_from_args(args: argparse.Namespace, rows: Optional[int] = None) -> dict:
+    return {
+        "rows": rows if rows is not None else args.rows,
+        "numeric": args.numeric,
+        "integer": args.integer,
+        "categorical": args.categorical,
+        "text": args.text,
+        "boolean": args.boolean,
+        "dates": args.dates,
+        "cardinality": args.cardinality,
+        "null_rate": args.null_rate,
+        "date_start": args.date_start,
+        "date_days": args.date_days,
+        "gap_rate": args.gap_rate,
+        "hourly": args.hourly,
+        "duplicate_rate": args.duplicate_rate,
+        "seed": args.seed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path")
+    add_arguments(parser)
+    args = parser.parse_args()
+    generate_csv(args.path, args.encoding, **spec_from_args(args))
+    print(args.path)
+
+
+if __name__ == "__main__":
+    main()
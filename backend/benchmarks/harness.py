@@ -0,0 +1,89 @@
+# benchmarks/harness.py
+"""
+Timing, memory and result-file helpers shared by the benchmarks.
+"""
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def best_of(fn: Callable, repeat: int) -> Tuple[float, object]:
+    """
+    Fastest of `repeat` calls in seconds, with the last call's result.
+    """
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def peak_memory_mb(fn: Callable) -> float:
+    """
+    Peak traced allocations of one call (NumPy and pandas buffers
+    included). Run separately from the timed calls: tracing slows
+    allocation-heavy code down.
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        fn()
+        return (tracemalloc.get_traced_memory()[1] - baseline) / 2**20
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+
+def measure(fn: Callable, repeat: int, memory: bool = True) -> Dict:
+    seconds, _ = best_of(fn, repeat)
+    result = {"seconds": round(seconds, 4)}
+    if memory:
+        result["peak_mb"] = round(peak_memory_mb(fn), 1)
+    return result
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> Dict:
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def write_results(path: str, benchmark: str, config: Dict, results) -> None:
+    """
+    JSON result file: {benchmark, environment, config, results}.
+    """
+    with open(path, "w") as handle:
+        json.dump(
+            {"benchmark": benchmark, "environment": environment(), "config": config, "results": results},
+            handle, indent=2, default=str,
+        )
+        handle.write("\n")
@@ -0,0 +1,315 @@
+# benchmarks/load_test.py
+"""
+Concurrent load against POST /api/ingest/csv, fully offline.
+
+Targets:
+    (default)      the app in-process through httpx's ASGI transport
+    --serve        a local uvicorn subprocess started for the run
+    --url URL      an already running server (memory is not sampled)
+
+Uploads are drawn from synthetic CSVs of several sizes (--sizes, with
+optional --weights). Load follows a profile of stages, each holding a
+number of concurrent clients for a number of seconds:
+    --stages 1:10 4:20 16:20      explicit concurrency:seconds steps
+    --ramp 1:32:60                linear ramp from 1 to 32 clients over 60 s
+
+Reports throughput, p50/p95/p99 latency, error and 503 rates, and the
+server's resident memory per stage.
+
+Needs httpx, which the app itself does not (pip install httpx).
+
+Usage (from backend/):
+    python -m benchmarks.load_test --sizes 1000 20000 200000 --stages 1:10 4:20 8:20
+    python -m benchmarks.load_test --serve --ramp 1:16:60 --output load.json
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - benchmark-only dependency
+    httpx = None
+
+from benchmarks import datasets
+from benchmarks.harness import write_results
+
+ENDPOINT = "/api/ingest/csv"
+MEMORY_INTERVAL_SECONDS = 0.5
+RAMP_STEPS = 10
+REQUEST_TIMEOUT_SECONDS = 300
+
+
+# --------------------------------------------------
+# Load profile
+# --------------------------------------------------
+def _parse_stages(stages: Optional[List[str]], ramp: Optional[str]) -> List[Tuple[int, float]]:
+    if ramp:
+        start, end, seconds = ramp.split(":")
+        levels = np.linspace(int(start), int(end), RAMP_STEPS).round().astype(int)
+        return [(int(level), float(seconds) / RAMP_STEPS) for level in levels]
+    return [(int(c), float(s)) for c, s in (stage.split(":") for stage in stages or ["1:10", "4:20"])]
+
+
+# --------------------------------------------------
+# Server memory
+# --------------------------------------------------
+def _rss_mb(pid: int) -> Optional[float]:
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+async def _sample_memory(pid: Optional[int], samples: List, started: float, stop: asyncio.Event) -> None:
+    while pid is not None and not stop.is_set():
+        rss = _rss_mb(pid)
+        if rss is not None:
+            samples.append((time.perf_counter() - started, rss))
+        try:
+            await asyncio.wait_for(stop.wait(), MEMORY_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+
+# --------------------------------------------------
+# Targets
+# --------------------------------------------------
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(cache: bool) -> Tuple[subprocess.Popen, str]:
+    port = _free_port()
+    env = dict(os.environ)
+    if not cache:
+        env["INGEST_CACHE_MAX_BYTES"] = "0"
+        env.pop("INGEST_CACHE_PATH", None)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        env=env,
+    )
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(url + "/", timeout=1)
+            return server, url
+        except httpx.TransportError:
+            if server.poll() is not None:
+                raise RuntimeError("uvicorn exited during startup")
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("uvicorn did not start within 30 s")
+
+
+def _in_process_client(cache: bool) -> "httpx.AsyncClient":
+    from app.main import app
+    from app.services.result_cache import result_cache
+
+    if not cache:
+        # Identical uploads would otherwise be answered from the cache
+        result_cache.disable()
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://load-test", timeout=REQUEST_TIMEOUT_SECONDS
+    )
+
+
+# --------------------------------------------------
+# Load generation
+# --------------------------------------------------
+async def _client(
+    worker: int,
+    http: "httpx.AsyncClient",
+    files: List[Tuple[str, bytes]],
+    weights: List[float],
+    state: Dict,
+    records: List[Dict],
+    started: float,
+    rng: random.Random,
+) -> None:
+    while not state["done"]:
+        if worker >= state["concurrency"]:
+            await asyncio.sleep(0.05)
+            continue
+
+        label, payload = rng.choices(files, weights)[0]
+        stage = state["stage"]
+        sent = time.perf_counter()
+        try:
+            response = await http.post(ENDPOINT, files={"file": ("load.csv", payload, "text/csv")})
+            status = response.status_code
+        except httpx.HTTPError:
+            status = None
+        records.append({
+            "stage": stage,
+            "size": label,
+            "start": sent - started,
+            "latency": time.perf_counter() - sent,
+            "status": status,
+        })
+
+
+async def _run(
+    http: "httpx.AsyncClient",
+    files: List[Tuple[str, bytes]],
+    weights: List[float],
+    stages: List[Tuple[int, float]],
+    pid: Optional[int],
+    seed: int,
+) -> Tuple[List[Dict], List]:
+    records, memory = [], []
+    state = {"concurrency": 0, "stage": 0, "done": False}
+    started = time.perf_counter()
+    stop = asyncio.Event()
+
+    sampler = asyncio.create_task(_sample_memory(pid, memory, started, stop))
+    clients = [
+        asyncio.create_task(_client(i, http, files, weights, state, records, started, random.Random(seed + i)))
+        for i in range(max(c for c, _ in stages))
+    ]
+
+    for index, (concurrency, seconds) in enumerate(stages):
+        state.update(concurrency=concurrency, stage=index)
+        await asyncio.sleep(seconds)
+
+    # In-flight requests finish and are attributed to the stage that sent them
+    state["done"] = True
+    await asyncio.gather(*clients)
+    stop.set()
+    await sampler
+    return records, memory
+
+
+# --------------------------------------------------
+# Report
+# --------------------------------------------------
+def _summary(records: List[Dict], seconds: float) -> Dict:
+    latencies = np.array([r["latency"] for r in records if r["status"] == 200])
+    errors = sum(1 for r in records if r["status"] != 200)
+    rejected = sum(1 for r in records if r["status"] == 503)
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if latencies.size else (np.nan,) * 3
+    return {
+        "requests": len(records),
+        "throughput_rps": round(latencies.size / seconds, 3) if seconds else 0.0,
+        "p50_s": round(float(p50), 4),
+        "p95_s": round(float(p95), 4),
+        "p99_s": round(float(p99), 4),
+        "error_rate": round(errors / len(records), 4) if records else 0.0,
+        "rejected_503": rejected,
+    }
+
+
+def _report(records: List[Dict], memory: List, stages: List[Tuple[int, float]]) -> List[Dict]:
+    rows, offset = [], 0.0
+    for index, (concurrency, seconds) in enumerate(stages):
+        stage_records = [r for r in records if r["stage"] == index]
+        stage_memory = [rss for t, rss in memory if offset <= t < offset + seconds]
+        rows.append({
+            "stage": index,
+            "concurrency": concurrency,
+            "seconds": seconds,
+            **_summary(stage_records, seconds),
+            "peak_rss_mb": round(max(stage_memory), 1) if stage_memory else None,
+        })
+        offset += seconds
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--serve", action="store_true", help="start a local uvicorn for the run")
+    target.add_argument("--url", help="base URL of a running server")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 20_000, 100_000], help="rows per upload")
+    parser.add_argument("--weights", type=float, nargs="+", help="relative frequency of each size")
+    parser.add_argument("--stages", nargs="+", metavar="CONCURRENCY:SECONDS")
+    parser.add_argument("--ramp", metavar="FROM:TO:SECONDS")
+    parser.add_argument("--cache", action="store_true", help="leave the result cache on (off by default)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    if httpx is None:
+        parser.exit(1, "load_test needs httpx: pip install httpx\n")
+
+    weights = args.weights or [1.0] * len(args.sizes)
+    if len(weights) != len(args.sizes):
+        parser.error("--weights needs one value per --sizes entry")
+    stages = _parse_stages(args.stages, args.ramp)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for rows in args.sizes:
+            path = datasets.generate_csv(os.path.join(tmp, f"{rows}.csv"), rows=rows, seed=args.seed)
+            with open(path, "rb") as handle:
+                files.append((f"{rows}_rows", handle.read()))
+
+    server, pid = None, None
+    if args.serve:
+        server, url = _start_server(args.cache)
+        http, pid = httpx.AsyncClient(base_url=url, timeout=REQUEST_TIMEOUT_SECONDS), server.pid
+    elif args.url:
+        http = httpx.AsyncClient(base_url=args.url, timeout=REQUEST_TIMEOUT_SECONDS)
+        if not args.cache:
+            print("note: the result cache of an external server cannot be turned off from here")
+    else:
+        http, pid = _in_process_client(args.cache), os.getpid()
+
+    async def run():
+        async with http:
+            return await _run(http, files, weights, stages, pid, args.seed)
+
+    try:
+        records, memory = asyncio.run(run())
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    rows = _report(records, memory, stages)
+    print(
+        f"{'stage':>5} {'clients':>7} {'requests':>8} {'rps':>7} {'p50_s':>7} {'p95_s':>7} "
+        f"{'p99_s':>7} {'err%':>6} {'503':>5} {'rss_mb':>7}"
+    )
+    for row in rows:
+        print(
+            f"{row['stage']:>5} {row['concurrency']:>7} {row['requests']:>8} {row['throughput_rps']:>7.2f} "
+            f"{row['p50_s']:>7.3f} {row['p95_s']:>7.3f} {row['p99_s']:>7.3f} {row['error_rate'] * 100:>6.1f} "
+            f"{row['rejected_503']:>5} {row['peak_rss_mb'] if row['peak_rss_mb'] is not None else '-':>7}"
+        )
+    total_seconds = sum(seconds for _, seconds in stages)
+    overall = _summary(records, total_seconds)
+    print(
+        f"total: {overall['requests']} requests, {overall['throughput_rps']:.2f} rps, "
+        f"p95 {overall['p95_s']:.3f}s, error rate {overall['error_rate']:.1%}"
+    )
+
+    if args.output:
+        config = {
+            "target": "uvicorn" if args.serve else (args.url or "in-process"),
+            "sizes": args.sizes, "weights": weights, "stages": stages, "cache": args.cache, "seed": args.seed,
+        }
+        results = {"stages": rows, "overall": overall, "memory": memory, "requests": records}
+        write_results(args.output, "load", config, results)
+        print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()